@@ -1,12 +1,208 @@
 #!/usr/bin/env python3
 import argparse
+import atexit
+import csv
+import os
+from collections import deque
 import pandas as pd
 import numpy as np
-import time
 import logging
-from datetime import datetime, timedelta
+import logging.handlers
+import queue
+from datetime import datetime
 from ib_insync import IB, util, Contract
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import talib
+except ImportError:
+    talib = None
+
+logger = logging.getLogger(__name__)
+
+# Keep the listener referenced so it can be stopped (and its queue
+# drained) at interpreter exit; its monitor thread is a daemon, so
+# records still queued when the process ends would otherwise be lost.
+_log_listener = None
+
+
+def _setup_logging():
+    """
+    Route records through a queue to a background listener so the file
+    write (and its flush) happens off the trading path; the hot path only
+    enqueues an unformatted record.
+    """
+    global _log_listener
+    if logger.handlers:
+        return
+    log_queue = queue.Queue(-1)
+    file_handler = logging.FileHandler('trade_log.txt')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+
+
+def _fused_indicators(price, high, low, span_fast, span_slow, period_rsi, period_atr):
+    """
+    Single-pass EMA(fast)/EMA(slow)/RSI/ATR over raw float64 arrays.
+    One traversal updates all four recurrences in registers instead of
+    four separate .ewm() sweeps (and their temporaries) over the price
+    column. Matches .ewm(span=..., adjust=False) seeding: first price
+    seeds the EMAs, RSI is neutral (50) until a delta exists, and the
+    first True Range falls back to high-low.
+    """
+    n = price.shape[0]
+    ema_fast = np.empty(n, dtype=np.float64)
+    ema_slow = np.empty(n, dtype=np.float64)
+    rsi = np.empty(n, dtype=np.float64)
+    atr = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return ema_fast, ema_slow, rsi, atr
+
+    a_fast = 2.0 / (span_fast + 1.0)
+    a_slow = 2.0 / (span_slow + 1.0)
+    a_rsi = 2.0 / (period_rsi + 1.0)
+    a_atr = 2.0 / (period_atr + 1.0)
+
+    ema_fast[0] = price[0]
+    ema_slow[0] = price[0]
+    rsi[0] = 50.0
+    atr[0] = high[0] - low[0]
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(1, n):
+        p = price[i]
+        ema_fast[i] = a_fast * p + (1.0 - a_fast) * ema_fast[i - 1]
+        ema_slow[i] = a_slow * p + (1.0 - a_slow) * ema_slow[i - 1]
+
+        delta = p - price[i - 1]
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        if i == 1:
+            avg_gain = gain
+            avg_loss = loss
+        else:
+            avg_gain = a_rsi * gain + (1.0 - a_rsi) * avg_gain
+            avg_loss = a_rsi * loss + (1.0 - a_rsi) * avg_loss
+        if avg_loss > 0.0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0.0:
+            rsi[i] = 100.0
+        else:
+            rsi[i] = 50.0
+
+        hl = high[i] - low[i]
+        hc = abs(high[i] - price[i - 1])
+        lc = abs(low[i] - price[i - 1])
+        tr = hl if hl >= hc else hc
+        if lc > tr:
+            tr = lc
+        atr[i] = a_atr * tr + (1.0 - a_atr) * atr[i - 1]
+
+    return ema_fast, ema_slow, rsi, atr
+
+
+if numba is not None:
+    _fused_indicators = numba.njit(cache=True, fastmath=True)(_fused_indicators)
+
+# Column order for trade_results.csv
+TRADE_COLUMNS = [
+    'Trade #', 'Entry Bar', 'Entry Time', 'Entry Price',
+    'Stop Loss', 'Take Profit', 'Exit Bar', 'Exit Time',
+    'Exit Price', 'Result', 'PnL'
+]
+
+
+class TradeLog:
+    """
+    Struct-of-arrays store for closed trades. Full trade rows are already
+    streamed to trade_results.csv as they close, so in memory we only keep
+    the columns the summary reduces over — PnL and win/loss — in
+    preallocated numpy arrays grown by doubling, instead of one dict
+    (~500 bytes) per trade.
+    """
+    def __init__(self, capacity=1024):
+        self.n = 0
+        self.pnl = np.empty(capacity, dtype=np.float64)
+        self.is_win = np.empty(capacity, dtype=bool)
+
+    def __len__(self):
+        return self.n
+
+    def append(self, pnl, is_win):
+        if self.n == len(self.pnl):
+            self.pnl = np.concatenate([self.pnl, np.empty_like(self.pnl)])
+            self.is_win = np.concatenate([self.is_win, np.empty_like(self.is_win)])
+        self.pnl[self.n] = pnl
+        self.is_win[self.n] = is_win
+        self.n += 1
+
+
+class StreamingIndicators:
+    """
+    O(1)-per-tick EMA(9)/EMA(21)/RSI(9)/ATR(9) state for live mode.
+
+    Each value is advanced with the EWMA recurrence
+    ema = alpha*x + (1-alpha)*ema_prev, so a tick costs a handful of
+    scalar ops regardless of history length — no .ewm().mean() over the
+    whole tail. Alphas follow the same span convention as the backtest's
+    .ewm(span=..., adjust=False).
+    """
+    def __init__(self, ema_fast=9, ema_slow=21, rsi_period=9, atr_period=9):
+        self._alpha_fast = 2.0 / (ema_fast + 1)
+        self._alpha_slow = 2.0 / (ema_slow + 1)
+        self._alpha_rsi = 2.0 / (rsi_period + 1)
+        self._alpha_atr = 2.0 / (atr_period + 1)
+        self.ema_fast = None
+        self.ema_slow = None
+        self.atr = None
+        self._avg_gain = None
+        self._avg_loss = None
+        self._prev_price = None
+
+    @staticmethod
+    def _ewma(prev, x, alpha):
+        return x if prev is None else alpha * x + (1.0 - alpha) * prev
+
+    def update(self, price, high, low):
+        """
+        Feed one tick; returns (ema_fast, ema_slow, rsi, atr).
+        """
+        if self._prev_price is None:
+            delta = 0.0
+            true_range = high - low
+        else:
+            delta = price - self._prev_price
+            true_range = max(high - low,
+                             abs(high - self._prev_price),
+                             abs(low - self._prev_price))
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        self.ema_fast = self._ewma(self.ema_fast, price, self._alpha_fast)
+        self.ema_slow = self._ewma(self.ema_slow, price, self._alpha_slow)
+        self._avg_gain = self._ewma(self._avg_gain, gain, self._alpha_rsi)
+        self._avg_loss = self._ewma(self._avg_loss, loss, self._alpha_rsi)
+        self.atr = self._ewma(self.atr, true_range, self._alpha_atr)
+        self._prev_price = price
+
+        if self._avg_loss > 0:
+            rsi = 100.0 - 100.0 / (1.0 + self._avg_gain / self._avg_loss)
+        elif self._avg_gain > 0:
+            rsi = 100.0
+        else:
+            rsi = 50.0  # neutral if no movement yet
+        return self.ema_fast, self.ema_slow, rsi, self.atr
+
+
 class EmaRsiAtrStrategy:
     def __init__(self, live_mode=False, historical_file=None, duration='5 D'):
         """
@@ -28,8 +224,13 @@ class EmaRsiAtrStrategy:
             self.ib = None
         
         self.active_trade = None
-        self.results = []
-        self.recent_bars = []  # rolling storage of bars (dicts)
+        self.results = TradeLog()
+        # Opened lazily on the first closed trade; rows are appended one
+        # at a time instead of rewriting the whole CSV per close.
+        self._csv_fh = None
+        self._csv_writer = None
+        # Rolling storage of bars (dicts); maxlen evicts the oldest in O(1)
+        self.recent_bars = deque(maxlen=50)
         self.trade_count = 0   # increments each time we open a new trade
         
         # -------------------------------------------------------------
@@ -49,11 +250,7 @@ class EmaRsiAtrStrategy:
             self.ib.connect()
         
         # Configure logging
-        logging.basicConfig(
-            filename='trade_log.txt',
-            level=logging.INFO,
-            format='%(asctime)s - %(message)s'
-        )
+        _setup_logging()
 
     # -------------------------------------------------------------------------
     # INDICATOR CALCULATIONS
@@ -63,6 +260,33 @@ class EmaRsiAtrStrategy:
         Compute EMA(9), EMA(21), RSI(9), ATR(9) for the entire DataFrame.
         Assumes columns: [time, price, high, low, volume].
         """
+        if talib is not None:
+            # Hand-tuned C loops, no Series wrapping. Note talib RSI/ATR
+            # use Wilder smoothing (TradingView-standard), which differs
+            # slightly from the span-based ewm of the fallback paths.
+            price = df['price'].to_numpy(dtype=np.float64)
+            high = df['high'].to_numpy(dtype=np.float64)
+            low = df['low'].to_numpy(dtype=np.float64)
+            df['ema9'] = talib.EMA(price, timeperiod=9)
+            df['ema21'] = talib.EMA(price, timeperiod=21)
+            df['rsi9'] = talib.RSI(price, timeperiod=9)
+            df['atr9'] = talib.ATR(high, low, price, timeperiod=9)
+            return df
+
+        if numba is not None:
+            # JIT'd fused kernel: one pass over the arrays for all four
+            # indicators. numba is optional; without it the pandas path
+            # below is faster than a plain-Python loop.
+            price = df['price'].to_numpy(dtype=np.float64)
+            high = df['high'].to_numpy(dtype=np.float64)
+            low = df['low'].to_numpy(dtype=np.float64)
+            ema9, ema21, rsi9, atr9 = _fused_indicators(price, high, low, 9, 21, 9, 9)
+            df['ema9'] = ema9
+            df['ema21'] = ema21
+            df['rsi9'] = rsi9
+            df['atr9'] = atr9
+            return df
+
         df['ema9'] = df['price'].ewm(span=9, adjust=False).mean()
         df['ema21'] = df['price'].ewm(span=21, adjust=False).mean()
         df['rsi9'] = self.compute_rsi(df['price'], period=9)
@@ -74,25 +298,29 @@ class EmaRsiAtrStrategy:
         Standard RSI calculation on 'series' (usually the close).
         """
         delta = series.diff()
-        gain = np.where(delta > 0, delta, 0.0)
-        loss = np.where(delta < 0, -delta, 0.0)
-        
-        avg_gain = pd.Series(gain).ewm(span=period, adjust=False).mean()
-        avg_loss = pd.Series(loss).ewm(span=period, adjust=False).mean()
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        return pd.Series(rsi).fillna(50)  # neutral if no data
+        # clip keeps everything as contiguous float64 Series — no
+        # Series -> ndarray -> Series round-trip around .ewm()
+        gain = delta.clip(lower=0.0)
+        loss = (-delta).clip(lower=0.0)
+
+        avg_gain = gain.ewm(span=period, adjust=False).mean()
+        avg_loss = loss.ewm(span=period, adjust=False).mean()
+
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        return rsi.fillna(50)  # neutral if no data
 
     def compute_atr(self, df, period=14):
         """
         Standard ATR(14) using columns [price (close), high, low].
         """
         prev_close = df['price'].shift(1)
-        high_low = df['high'] - df['low']
-        high_close = (df['high'] - prev_close).abs()
-        low_close = (df['low'] - prev_close).abs()
-        tr = high_low.combine(high_close, max).combine(low_close, max)
+        high_low = (df['high'] - df['low']).to_numpy()
+        high_close = (df['high'] - prev_close).abs().to_numpy()
+        low_close = (df['low'] - prev_close).abs().to_numpy()
+        # Series.combine(max) loops elementwise in Python; one C-level
+        # reduction over the three arrays computes True Range instead.
+        tr = pd.Series(np.maximum.reduce([high_low, high_close, low_close]),
+                       index=df.index)
         atr = tr.ewm(span=period, adjust=False).mean()
         # Fill from bottom up, then zero if still NaN
         atr = atr.bfill().fillna(0)
@@ -106,17 +334,17 @@ class EmaRsiAtrStrategy:
         Downloads 1-minute historical data from IB for 'duration'.
         """
         if not self.ib:
-            logging.info("IB instance not available. Cannot download historical data.")
+            logger.info("IB instance not available. Cannot download historical data.")
             return None
         
         try:
             qualified_contracts = self.ib.qualifyContracts(self.contract)
             if not qualified_contracts:
-                logging.info("No valid contract found for MESH5.")
+                logger.info("No valid contract found for MESH5.")
                 return None
             
             self.contract = qualified_contracts[0]
-            logging.info(f"Downloading {self.duration} of 1-min bars for MESH5...")
+            logger.info(f"Downloading {self.duration} of 1-min bars for MESH5...")
             bars = self.ib.reqHistoricalData(
                 self.contract,
                 endDateTime='',
@@ -128,19 +356,19 @@ class EmaRsiAtrStrategy:
                 keepUpToDate=False
             )
             if not bars or len(bars) == 0:
-                logging.info("No historical data returned.")
+                logger.info("No historical data returned.")
                 return None
             
             df = util.df(bars)
             if df.empty:
-                logging.info("Historical data is empty.")
+                logger.info("Historical data is empty.")
                 return None
             
             df.rename(columns={'date': 'time', 'close': 'price'}, inplace=True)
             df['time'] = pd.to_datetime(df['time'])
             return df
         except Exception as e:
-            logging.error(f"Error downloading data: {e}")
+            logger.error(f"Error downloading data: {e}")
             return None
 
     def monitor_market(self):
@@ -154,29 +382,41 @@ class EmaRsiAtrStrategy:
 
     def run_live(self):
         """
-        Subscribes to real-time data from IB.
+        Subscribes to real-time data from IB. Ticks are dispatched from
+        ib_insync's pendingTickersEvent, so process_tick fires the moment
+        a tick arrives instead of a once-per-second polling loop that
+        burns CPU and misses sub-second updates.
         """
         self.ib.qualifyContracts(self.contract)
         self.ib.reqMktData(self.contract, '', False, False)
-        logging.info("Running LIVE on MESH5 (2025-03-21).")
-        
-        while True:
-            ticker = self.ib.ticker(self.contract)
-            if ticker and ticker.marketPrice():
+        logger.info("Running LIVE on MESH5 (2025-03-21).")
+
+        stream = StreamingIndicators()
+
+        def on_pending_tickers(tickers):
+            for ticker in tickers:
+                if ticker.contract != self.contract or not ticker.marketPrice():
+                    continue
+                price = ticker.marketPrice()
+                high = ticker.high or price
+                low = ticker.low or price
+                ema9, ema21, rsi9, atr9 = stream.update(price, high, low)
                 bar = {
                     'time': datetime.now(),
-                    'price': ticker.marketPrice(),
-                    'high': ticker.high or ticker.marketPrice(),
-                    'low': ticker.low or ticker.marketPrice(),
+                    'price': price,
+                    'high': high,
+                    'low': low,
                     'volume': ticker.volume or 0,
-                    'ema9': None,
-                    'ema21': None,
-                    'rsi9': None,
-                    'atr9': None,
+                    'ema9': ema9,
+                    'ema21': ema21,
+                    'rsi9': rsi9,
+                    'atr9': atr9,
                     'bar_index': None
                 }
                 self.process_tick(bar)
-            time.sleep(1)
+
+        self.ib.pendingTickersEvent += on_pending_tickers
+        self.ib.run()
 
     def run_backtest(self):
         """
@@ -184,7 +424,12 @@ class EmaRsiAtrStrategy:
         and processes bars with a 1-hour warm-up period before opening trades.
         """
         if self.historical_file:
-            df = pd.read_csv(self.historical_file)
+            # Parquet decodes columnar data straight to numpy, far faster
+            # than re-parsing CSV text on every run.
+            if self.historical_file.endswith('.parquet'):
+                df = pd.read_parquet(self.historical_file)
+            else:
+                df = pd.read_csv(self.historical_file)
             # Minimal cleanup
             if 'date' in df.columns and 'time' not in df.columns:
                 df.rename(columns={'date': 'time'}, inplace=True)
@@ -197,17 +442,35 @@ class EmaRsiAtrStrategy:
             df['time'] = pd.to_datetime(df['time'])
             df.sort_values(by='time', inplace=True)
         else:
-            df = self.download_historical_data()
-            if df is None or df.empty:
-                logging.info("No data for backtest. Exiting.")
-                return
+            cache_file = os.path.join(
+                'cache', f"MESH5_{self.duration.replace(' ', '')}.parquet"
+            )
+            if os.path.exists(cache_file):
+                logger.info(f"Loading cached bars from {cache_file}.")
+                df = pd.read_parquet(cache_file)
+            else:
+                df = self.download_historical_data()
+                if df is None or df.empty:
+                    logger.info("No data for backtest. Exiting.")
+                    return
+                try:
+                    os.makedirs('cache', exist_ok=True)
+                    df.to_parquet(cache_file, index=False)
+                except Exception as e:
+                    # e.g. pyarrow not installed — caching is best-effort
+                    logger.info(f"Could not cache bars to parquet: {e}")
         
         # Ensure minimal columns
         df = df[['time', 'price', 'high', 'low', 'volume']]
+        # MES prices carry ~5 significant digits, so float32 is plenty and
+        # halves the memory bandwidth of the (memory-bound) indicator
+        # passes. PnL accumulation stays float64 downstream.
+        for col in ('price', 'high', 'low'):
+            df[col] = df[col].astype(np.float32)
         # Compute indicators
         df = self.compute_indicators(df)
         
-        logging.info("Running backtest with EMA(9), EMA(21), RSI(9), ATR(9).")
+        logger.info("Running backtest with EMA(9), EMA(21), RSI(9), ATR(9).")
         
         # -------------------------------------------
         # WARM-UP PERIOD: 1 HOUR from the first bar
@@ -217,15 +480,72 @@ class EmaRsiAtrStrategy:
             warmup_cutoff = first_timestamp + pd.Timedelta(hours=1)
         else:
             warmup_cutoff = None
-        
-        # Process each bar
-        for idx, row in df.iterrows():
-            tick = row.to_dict()
-            tick['bar_index'] = idx
-            self.process_tick(tick, warmup_cutoff=warmup_cutoff)
-        
+
+        self._simulate(df, warmup_cutoff)
         self.print_backtest_summary()
 
+    def _simulate(self, df, warmup_cutoff):
+        """
+        Compact event loop over raw ndarray columns. The entry signal is
+        precomputed in one vectorized boolean pass; the remaining per-bar
+        Python work is just the stateful trade management that cannot be
+        vectorized (one open trade at a time). Dicts are only built on the
+        rare open/close events, not per bar.
+        """
+        times = df['time'].to_numpy()
+        # Integer view of the timestamps: ordering checks and the warmup
+        # binary search run on raw int64 ns instead of datetime64 objects;
+        # 'times' itself is only touched on open/close events.
+        time_ns = times.astype('int64')
+        # Bars must be strictly increasing: vectorized replacement for the
+        # per-bar check_bar_order comparison.
+        if len(time_ns) > 1 and (np.diff(time_ns) <= 0).any():
+            msg = "Timestamp error: bar times are not strictly increasing"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        # Keep the columns' native dtype (float32 after the downcast on
+        # load) — no upcasting copies; comparisons work the same.
+        prices = df['price'].to_numpy()
+        atr9 = df['atr9'].to_numpy()
+        ema9 = df['ema9'].to_numpy()
+        ema21 = df['ema21'].to_numpy()
+        rsi9 = df['rsi9'].to_numpy()
+
+        # NaN indicators compare False, so warm-up rows where the EMAs are
+        # not yet meaningful can never signal; no per-bar None/NaN checks
+        # needed. The ATR fallback (2.0 when missing or non-positive) is
+        # also folded into one vector pass.
+        signal = (ema9 > ema21) & (rsi9 > 50)
+        entry_atr = np.where(atr9 > 0, atr9, 2.0)
+        # Times are sorted, so the warmup boundary is a single binary
+        # search rather than a per-bar comparison. No trade can exist
+        # before it, so the loop simply starts there.
+        if warmup_cutoff is not None:
+            cutoff_ns = np.datetime64(warmup_cutoff, 'ns').astype('int64')
+            warmup_idx = int(np.searchsorted(time_ns, cutoff_ns))
+        else:
+            warmup_idx = 0
+
+        for i in range(warmup_idx, len(prices)):
+            price = prices[i]
+            # Open/close events are rare, so boxing the raw datetime64
+            # back into a Timestamp only there keeps the CSV rendering
+            # ('2025-01-02 09:30:00', not ...T09:30:00.000000000) without
+            # paying for a conversion on every bar.
+            if self.active_trade is not None:
+                if price >= self.active_trade['Take Profit']:
+                    self.log_trade({'bar_index': i, 'time': pd.Timestamp(times[i]),
+                                    'price': price}, 'Profit')
+                elif price <= self.active_trade['Stop Loss']:
+                    self.log_trade({'bar_index': i, 'time': pd.Timestamp(times[i]),
+                                    'price': price}, 'Loss')
+                continue
+
+            if signal[i]:
+                self.open_trade({'bar_index': i, 'time': pd.Timestamp(times[i]),
+                                 'price': price}, entry_atr[i])
+
     # -------------------------------------------------------------------------
     # STRATEGY LOGIC
     # -------------------------------------------------------------------------
@@ -235,15 +555,16 @@ class EmaRsiAtrStrategy:
         """
         if not self.recent_bars:
             return False
-        
+
         last_bar = self.recent_bars[-1]
-        # If any indicator is missing, skip
-        if any(last_bar.get(ind) is None for ind in ['ema9','ema21','rsi9','atr9']):
+        ema9 = last_bar['ema9']
+        ema21 = last_bar['ema21']
+        rsi9 = last_bar['rsi9']
+        # Indicators are always real floats now (StreamingIndicators in
+        # live mode), with NaN marking missing — no None dict-get chain.
+        if np.isnan(ema9) or np.isnan(ema21) or np.isnan(rsi9):
             return False
-        
-        ema_condition = (last_bar['ema9'] > last_bar['ema21'])
-        rsi_condition = (last_bar['rsi9'] > 50)
-        return (ema_condition and rsi_condition)
+        return ema9 > ema21 and rsi9 > 50
 
     def process_tick(self, tick, warmup_cutoff=None):
         """
@@ -254,9 +575,7 @@ class EmaRsiAtrStrategy:
         """
         self.check_bar_order(tick)
         self.recent_bars.append(tick)
-        if len(self.recent_bars) > 50:
-            self.recent_bars.pop(0)
-        
+
         # If there's already an open trade, manage it
         if self.active_trade is not None:
             self.manage_trade(tick)
@@ -277,7 +596,7 @@ class EmaRsiAtrStrategy:
             last_time = self.recent_bars[-1]['time']
             if tick['time'] <= last_time:
                 msg = f"Timestamp error: {tick['time']} is not after {last_time}"
-                logging.error(msg)
+                logger.error(msg)
                 raise ValueError(msg)
 
     def check_for_trade_setup(self, tick):
@@ -289,26 +608,33 @@ class EmaRsiAtrStrategy:
             if not atr_val or atr_val <= 0:
                 # fallback if missing
                 atr_val = 2.0
-            
-            stop_loss = tick['price'] - (atr_val * 1.5)
-            take_profit = tick['price'] + (atr_val * 3)
-            
-            self.trade_count += 1
-            self.active_trade = {
-                'Trade #': self.trade_count,
-                'Entry Bar': tick.get('bar_index'),
-                'Entry Time': tick['time'],
-                'Entry Price': tick['price'],
-                'Stop Loss': stop_loss,
-                'Take Profit': take_profit,
-                'Exit Bar': None,
-                'Exit Time': None,
-                'Exit Price': None,
-                'Result': None,
-                'PnL': 0.0
-            }
-            
-            logging.info(
+            self.open_trade(tick, atr_val)
+
+    def open_trade(self, tick, atr_val):
+        """
+        Opens a new LONG trade at this bar's price with ATR-based SL/TP.
+        """
+        stop_loss = tick['price'] - (atr_val * 1.5)
+        take_profit = tick['price'] + (atr_val * 3)
+
+        self.trade_count += 1
+        self.active_trade = {
+            'Trade #': self.trade_count,
+            'Entry Bar': tick.get('bar_index'),
+            'Entry Time': tick['time'],
+            'Entry Price': tick['price'],
+            'Stop Loss': stop_loss,
+            'Take Profit': take_profit,
+            'Exit Bar': None,
+            'Exit Time': None,
+            'Exit Price': None,
+            'Result': None,
+            'PnL': 0.0
+        }
+
+        # Guarded so the f-string isn't built when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
                 f"[Trade] OPEN #{self.trade_count} at bar {tick.get('bar_index')} "
                 f"(price={tick['price']}, SL={stop_loss}, TP={take_profit}, time={tick['time']})"
             )
@@ -337,41 +663,45 @@ class EmaRsiAtrStrategy:
         self.active_trade['PnL'] = points * self.tick_value
         
         trade_num = self.active_trade['Trade #']
-        logging.info(
-            f"[Trade] CLOSE #{trade_num} with {result} at bar {tick.get('bar_index')} "
-            f"(price={tick['price']}, time={tick['time']}, PnL={self.active_trade['PnL']})"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"[Trade] CLOSE #{trade_num} with {result} at bar {tick.get('bar_index')} "
+                f"(price={tick['price']}, time={tick['time']}, PnL={self.active_trade['PnL']})"
+            )
         
-        self.results.append(self.active_trade.copy())
+        self.results.append(self.active_trade['PnL'], result == 'Profit')
+        self.save_results(self.active_trade)
         self.active_trade = None
-        self.save_results()
 
-    def save_results(self):
-        """
-        Saves trade history to 'trade_results.csv' after each closed trade
-        with the EXACT columns you requested, in the same order.
-        """
-        # Force the columns to appear in the exact sequence you specified:
-        columns_order = [
-            'Trade #', 'Entry Bar', 'Entry Time', 'Entry Price',
-            'Stop Loss', 'Take Profit', 'Exit Bar', 'Exit Time',
-            'Exit Price', 'Result', 'PnL'
-        ]
-        df = pd.DataFrame(self.results, columns=columns_order)
-        df.to_csv('trade_results.csv', index=False)
+    def save_results(self, trade):
+        """
+        Appends one closed trade to 'trade_results.csv', with the EXACT
+        columns you requested, in the same order. The file is opened once
+        (header written then) and each close costs a single row write,
+        instead of rebuilding a DataFrame and rewriting the whole file.
+        """
+        if self._csv_writer is None:
+            self._csv_fh = open('trade_results.csv', 'w', newline='')
+            self._csv_writer = csv.DictWriter(self._csv_fh, fieldnames=TRADE_COLUMNS)
+            self._csv_writer.writeheader()
+        self._csv_writer.writerow(trade)
+        self._csv_fh.flush()
 
     def print_backtest_summary(self):
         """
         Logs final stats: # trades, winners, losers, total PnL, profit factor, etc.
         """
         total_trades = len(self.results)
-        winners = sum(1 for t in self.results if t['Result'] == 'Profit')
-        losers = sum(1 for t in self.results if t['Result'] == 'Loss')
-        total_pnl = sum(t['PnL'] for t in self.results)
+        # The TradeLog columns are already numpy arrays, so every stat is
+        # a vectorized reduction.
+        pnl = self.results.pnl[:total_trades]
+        winners = int(self.results.is_win[:total_trades].sum())
+        losers = total_trades - winners
+        total_pnl = pnl.sum()
 
         # Calculate profit factor: (Sum of winning PnL) / (absolute sum of losing PnL)
-        winning_pnl = sum(t['PnL'] for t in self.results if t['PnL'] > 0)
-        losing_pnl = sum(t['PnL'] for t in self.results if t['PnL'] < 0)
+        winning_pnl = pnl[pnl > 0].sum()
+        losing_pnl = pnl[pnl < 0].sum()
         if losing_pnl != 0:
             profit_factor = winning_pnl / abs(losing_pnl)
             profit_factor_str = f"{profit_factor:.2f}"
@@ -385,7 +715,7 @@ class EmaRsiAtrStrategy:
             f"Profit Factor: {profit_factor_str}, "
             f"Duration={self.duration}"
         )
-        logging.info(summary_str)
+        logger.info(summary_str)
         # No print statement—only log
 
 if __name__ == '__main__':
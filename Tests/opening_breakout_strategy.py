@@ -42,6 +42,11 @@ class OpeningBreakoutStrategy(bt.Strategy):
         # Flag to mark when we’ve captured the opening range
         self.open_range_recorded = False
 
+        # Session boundaries are constant within a day; cache them so we
+        # only pay the datetime construction once per date, not per bar
+        self._cached_date = None
+        self._session_open_range_end = None
+
     def start(self):
         """
         Called once when the strategy starts.
@@ -63,8 +68,13 @@ class OpeningBreakoutStrategy(bt.Strategy):
             self.open_range_recorded = False
         
         # 2) During the opening range (e.g. first 30 minutes), track high/low
-        session_start = datetime.datetime.combine(current_date, self.params.session_start_time)
-        session_open_range_end = session_start + datetime.timedelta(minutes=self.params.session_open_range_minutes)
+        if current_date != self._cached_date:
+            self._cached_date = current_date
+            session_start = datetime.datetime.combine(current_date, self.params.session_start_time)
+            self._session_open_range_end = session_start + datetime.timedelta(
+                minutes=self.params.session_open_range_minutes
+            )
+        session_open_range_end = self._session_open_range_end
         
         # Convert current backtrader datetime to a Python datetime
         # (Backtrader's data feed often merges date+time in a single float).
@@ -99,34 +109,27 @@ class OpeningBreakoutStrategy(bt.Strategy):
 
     def _enter_position(self, direction='long'):
         """
-        Helper method to enter a trade (long or short)
-        and place associated stop-loss & take-profit orders.
+        Helper method to enter a trade (long or short) with its stop-loss
+        and take-profit. buy_bracket/sell_bracket submit all three orders
+        in one dispatch with the parent linkage handled by backtrader.
         """
+        size = self._calc_position_size()
+        entry_price = self.data.close[0]
+
         if direction == 'long':
-            size = self._calc_position_size()
-            entry_price = self.data.close[0]
-            stop_price = entry_price * (1.0 - self.params.stop_loss_pct)
-            take_profit_price = entry_price * (1.0 + self.params.take_profit_pct)
-            
-            # Enter Long
-            buy_order = self.buy(size=size)
-            
-            # Place bracket orders (stop-loss and take-profit)
-            self.sell(size=size, exectype=bt.Order.Stop, price=stop_price, parent=buy_order)
-            self.sell(size=size, exectype=bt.Order.Limit, price=take_profit_price, parent=buy_order)
-        
+            self.buy_bracket(
+                size=size,
+                exectype=bt.Order.Market,
+                stopprice=entry_price * (1.0 - self.params.stop_loss_pct),
+                limitprice=entry_price * (1.0 + self.params.take_profit_pct),
+            )
         elif direction == 'short':
-            size = self._calc_position_size()
-            entry_price = self.data.close[0]
-            stop_price = entry_price * (1.0 + self.params.stop_loss_pct)
-            take_profit_price = entry_price * (1.0 - self.params.take_profit_pct)
-            
-            # Enter Short
-            sell_order = self.sell(size=size)
-            
-            # Place bracket orders
-            self.buy(size=size, exectype=bt.Order.Stop, price=stop_price, parent=sell_order)
-            self.buy(size=size, exectype=bt.Order.Limit, price=take_profit_price, parent=sell_order)
+            self.sell_bracket(
+                size=size,
+                exectype=bt.Order.Market,
+                stopprice=entry_price * (1.0 + self.params.stop_loss_pct),
+                limitprice=entry_price * (1.0 - self.params.take_profit_pct),
+            )
 
     def _calc_position_size(self):
         """
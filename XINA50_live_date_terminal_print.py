@@ -6,22 +6,17 @@ from ibapi.contract import Contract
 from ibapi.common import TickAttribLast
 import time
 import threading
-from datetime import datetime, timedelta
+from datetime import datetime
 
 
-def align_to_bar_boundary(dt, bar_length=30):
+def align_to_bar_boundary(ts, bar_length=30):
     """
-    Returns a new datetime 'anchored' to the most recent
-    bar boundary in multiples of 'bar_length' seconds.
-    For bar_length=30, those boundaries are :00 and :30.
+    Anchor an epoch timestamp (seconds) to the most recent bar boundary
+    in multiples of 'bar_length' seconds. For bar_length=30, those
+    boundaries are :00 and :30. Pure integer arithmetic — no datetime
+    objects on the tick path.
     """
-    # e.g. if dt.second is 37 and bar_length=30, remainder = 7
-    # so anchored_second = 30
-    second_of_minute = dt.second
-    remainder = second_of_minute % bar_length
-    anchored_second = second_of_minute - remainder
-    # Zero out microseconds so we don't drift
-    return dt.replace(second=anchored_second, microsecond=0)
+    return ts - (ts % bar_length)
 
 
 class IBApi(EWrapper, EClient):
@@ -40,8 +35,9 @@ class IBApi(EWrapper, EClient):
                           time_: int, price: float, size: int,
                           tickAttribLast: TickAttribLast,
                           exchange: str, specialConditions: str):
-        trade_time = datetime.fromtimestamp(time_)
-        self.aggregator.on_new_trade(trade_time, price, size)
+        # time_ is already epoch seconds; keep it as an int on the hot
+        # path and only build a datetime when a bar is printed.
+        self.aggregator.on_new_trade(time_, price, size)
 
 
 class TradeAggregator:
@@ -50,8 +46,7 @@ class TradeAggregator:
     anchored to clock boundaries (so bars start at :00 or :30).
     """
     def __init__(self, bar_length=30):
-        self.bar_length = bar_length
-        self.delta = timedelta(seconds=bar_length)
+        self.bar_length = bar_length  # seconds; state below is epoch seconds
         self.bar_start = None  # Keep track of the current bar's start
         self.open_price = None
         self.high_price = None
@@ -59,26 +54,26 @@ class TradeAggregator:
         self.close_price = None
         self.volume = 0
 
-    def on_new_trade(self, trade_time, price, size):
+    def on_new_trade(self, trade_ts, price, size):
         """
         Update or finalize bars based on the incoming trade.
+        'trade_ts' is epoch seconds straight from IB; all the boundary
+        arithmetic here is plain integer math, so the per-tick cost is a
+        few compares instead of datetime construction and comparison.
         1) If we have no current bar, anchor to the clock boundary.
-        2) If trade_time has moved beyond the current bar’s boundary,
+        2) If the trade has moved beyond the current bar's boundary,
            finalize the old bar(s), step forward in 30s increments,
            then record the trade in the new bar.
         """
         # If we have no bar in progress, create one anchored to the last boundary
         if self.bar_start is None:
-            candidate_start = align_to_bar_boundary(trade_time, self.bar_length)
-            while trade_time >= candidate_start + self.delta:
-                candidate_start += self.delta
-            self.bar_start = candidate_start
+            self.bar_start = align_to_bar_boundary(trade_ts, self.bar_length)
 
         # If this trade is beyond the end of the current bar window,
         # finalize the bar(s) and move forward.
-        while trade_time >= self.bar_start + self.delta:
+        while trade_ts >= self.bar_start + self.bar_length:
             self.finalize_bar()
-            self.bar_start += self.delta
+            self.bar_start += self.bar_length
 
         # Now trade_time is within self.bar_start..self.bar_start + self.delta
         self.update_current_bar(price, size)
@@ -107,9 +102,11 @@ class TradeAggregator:
         we increment it in on_new_trade() if needed.
         """
         if self.open_price is not None:
-            bar_end_time = self.bar_start + self.delta
+            # Only here, once per bar, do we pay for datetime formatting
+            bar_start_time = datetime.fromtimestamp(self.bar_start)
+            bar_end_time = datetime.fromtimestamp(self.bar_start + self.bar_length)
             print(
-                f"[{self.bar_start.strftime('%H:%M:%S')} - "
+                f"[{bar_start_time.strftime('%H:%M:%S')} - "
                 f"{bar_end_time.strftime('%H:%M:%S')}] "
                 f"O:{self.open_price:.2f} H:{self.high_price:.2f} "
                 f"L:{self.low_price:.2f} C:{self.close_price:.2f} "
@@ -1,23 +1,51 @@
 #!/usr/bin/env python3
+import math
+import sys
 import threading
-import time
+from functools import lru_cache
+
+import numpy as np
 from ibapi.client import EClient
 from ibapi.wrapper import EWrapper
 from ibapi.contract import Contract
 
+# Fallback exchange per security type, used when positions come back
+# without one (position() often omits it).
+_DEFAULT_EXCHANGE = {"STK": "SMART", "FUT": "GLOBEX"}
+
+@lru_cache(maxsize=256)
+def _make_contract(symbol, secType, exchange, currency, localSymbol, multiplier):
+    """
+    Build (and memoize) a market-data contract from its identifying
+    fields. Positions are stable across polls, so repeat calls skip the
+    construction entirely.
+    """
+    c = Contract()
+    c.symbol = symbol
+    c.secType = secType
+    c.exchange = exchange
+    c.currency = currency
+    c.localSymbol = localSymbol
+    c.multiplier = multiplier
+    return c
+
 class IBTerminalApp(EWrapper, EClient):
     def __init__(self):
         EClient.__init__(self, self)
         # Store positions as tuples: (account, contract, position, avgCost)
         self.positions = []
         self.account_values = {}  # Dict of key -> (value, currency)
-        # For snapshot market data: maps reqId to last price.
-        self.market_data_prices = {}
+        # Snapshot last prices, indexed by position; NaN = not received.
+        self.market_data_prices = np.empty(0, dtype=np.float64)
         # Map reqId to position index.
         self.position_mkt_req_map = {}
         # Events for when downloads complete.
         self.positions_event = threading.Event()
         self.account_event = threading.Event()
+        self.account_stop_event = threading.Event()
+        # Outstanding snapshot reqIds; cleared as tickSnapshotEnd arrives.
+        self.snapshot_pending = set()
+        self.snapshot_done_event = threading.Event()
         self.account_code = None
 
     def managedAccounts(self, accountsList: str):
@@ -38,9 +66,13 @@ class IBTerminalApp(EWrapper, EClient):
     def accountDownloadEnd(self, accountName: str):
         print("Account update download finished for account:", accountName)
         self.account_event.set()
+        # Also acks the unsubscribe at shutdown (main clears this first).
+        self.account_stop_event.set()
 
     def position(self, account: str, contract, pos: float, avgCost: float):
-        # Store the full contract as provided.
+        # Store the full contract as provided, parsing its multiplier
+        # once here so downstream loops just read the cached float.
+        contract._mult = _safe_mult(contract)
         self.positions.append((account, contract, pos, avgCost))
 
     def positionEnd(self):
@@ -50,7 +82,16 @@ class IBTerminalApp(EWrapper, EClient):
     def tickPrice(self, reqId, tickType, price, attrib):
         # Use tickType 4 (Last Price) for snapshot market data.
         if tickType == 4:
-            self.market_data_prices[reqId] = price
+            pos_idx = self.position_mkt_req_map.get(reqId)
+            if pos_idx is not None:
+                self.market_data_prices[pos_idx] = price
+
+    def tickSnapshotEnd(self, reqId: int):
+        # Fired once per snapshot request; when the last outstanding
+        # request completes, release the waiter immediately.
+        self.snapshot_pending.discard(reqId)
+        if not self.snapshot_pending:
+            self.snapshot_done_event.set()
 
     def error(self, reqId, errorCode, errorString):
         print(f"Error. ReqId: {reqId}, Code: {errorCode}, Msg: {errorString}")
@@ -60,67 +101,58 @@ class IBTerminalApp(EWrapper, EClient):
         For each stored position, create a new contract (filling in any missing details)
         and request snapshot market data.
         """
-        self.market_data_prices = {}
+        self.market_data_prices = np.full(len(self.positions), np.nan, dtype=np.float64)
         self.position_mkt_req_map = {}
+        self.snapshot_done_event.clear()
         reqId_start = 1000
         for i, (account, contract, pos, avgCost) in enumerate(self.positions):
             reqId = reqId_start + i
             self.position_mkt_req_map[reqId] = i
-
-            # Create a fresh contract and copy available details.
-            new_contract = Contract()
-            new_contract.symbol = contract.symbol
-            new_contract.secType = contract.secType
-
-            # Fill in exchange if missing.
-            if not contract.exchange or contract.exchange.strip() == "":
-                if contract.secType == "STK":
-                    new_contract.exchange = "SMART"
-                elif contract.secType == "FUT":
-                    new_contract.exchange = "GLOBEX"
-                else:
-                    new_contract.exchange = "SMART"
-            else:
-                new_contract.exchange = contract.exchange
-
-            # Fill in currency if missing.
-            if not contract.currency or contract.currency.strip() == "":
-                new_contract.currency = "USD"
-            else:
-                new_contract.currency = contract.currency
-
-            # For futures, localSymbol is often required.
-            if hasattr(contract, "localSymbol") and contract.localSymbol:
-                new_contract.localSymbol = contract.localSymbol
-            else:
-                new_contract.localSymbol = contract.symbol
-
-            # Copy multiplier if available, otherwise default to "1".
-            if hasattr(contract, "multiplier") and contract.multiplier:
-                new_contract.multiplier = contract.multiplier
-            else:
-                new_contract.multiplier = "1"
+            # Register before sending so a fast tickSnapshotEnd can't race.
+            self.snapshot_pending.add(reqId)
+
+            # Normalize missing details with straight-line 'value or
+            # default' expressions, then fetch the (cached) contract.
+            # localSymbol is often required for futures.
+            new_contract = _make_contract(
+                contract.symbol,
+                contract.secType,
+                ((contract.exchange or "").strip()
+                 or _DEFAULT_EXCHANGE.get(contract.secType, "SMART")),
+                (contract.currency or "").strip() or "USD",
+                getattr(contract, "localSymbol", "") or contract.symbol,
+                getattr(contract, "multiplier", "") or "1",
+            )
 
             # Request snapshot market data using the new contract.
             self.reqMktData(reqId, new_contract, "", True, False, [])
-        # Allow time for snapshot data to arrive.
-        time.sleep(5)
+        # Wait for every snapshot to report completion (bounded), rather
+        # than sleeping a fixed 5s regardless of how fast ticks arrive.
+        if self.snapshot_pending and not self.snapshot_done_event.wait(timeout=5):
+            print(f"Timeout waiting for {len(self.snapshot_pending)} market data snapshot(s).")
         # Cancel all market data subscriptions.
         for reqId in self.position_mkt_req_map:
             self.cancelMktData(reqId)
 
+def _safe_mult(contract):
+    """Contract multiplier as a float, defaulting to 1.0."""
+    try:
+        mult = getattr(contract, "multiplier", "")
+        return float(mult) if mult and mult.strip() else 1.0
+    except (TypeError, ValueError):
+        return 1.0
+
 def print_table(header, rows):
-    col_widths = [len(str(h)) for h in header]
-    for row in rows:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(str(cell)))
+    # Build the whole table as one string and emit it with a single
+    # write; one print() per row means one lock/flush per row.
+    str_rows = [[str(cell) for cell in row] for row in rows]
+    col_widths = [max(map(len, col)) for col in zip(*([list(map(str, header))] + str_rows))]
     sep = " | "
-    header_line = sep.join([f"{h:<{col_widths[i]}}" for i, h in enumerate(header)])
-    divider = "-" * len(header_line)
-    print(header_line)
-    print(divider)
-    for row in rows:
-        print(sep.join([f"{str(cell):<{col_widths[i]}}" for i, cell in enumerate(row)]))
+    header_line = sep.join(f"{h:<{w}}" for h, w in zip(header, col_widths))
+    lines = [header_line, "-" * len(header_line)]
+    lines.extend(sep.join(f"{cell:<{w}}" for cell, w in zip(row, col_widths))
+                 for row in str_rows)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     app = IBTerminalApp()
@@ -145,28 +177,29 @@ def main():
 
     pos_header = ["Account", "Symbol", "SecType", "Position", "AvgCost", "Current Price", "Total PnL"]
     pos_rows = []
-    for i, (account, contract, pos, avgCost) in enumerate(app.positions):
-        reqId = 1000 + i
-        current_price = app.market_data_prices.get(reqId, "N/A")
-        if current_price != "N/A" and isinstance(current_price, (float, int)):
-            try:
-                multiplier = float(contract.multiplier) if hasattr(contract, "multiplier") and contract.multiplier and contract.multiplier.strip() != "" else 1.0
-            except Exception:
-                multiplier = 1.0
-            pnl = (current_price - avgCost) * pos * multiplier
-            pnl = round(pnl, 2)
-            current_price = round(current_price, 2)
-        else:
-            pnl = "N/A"
-        pos_rows.append([
-            account,
-            contract.symbol,
-            contract.secType,
-            pos,
-            avgCost,
-            current_price,
-            pnl
-        ])
+    if app.positions:
+        # PnL for every position in one vector expression; rows with no
+        # snapshot price stay NaN and render as "N/A".
+        n = len(app.positions)
+        prices = (app.market_data_prices if app.market_data_prices.size == n
+                  else np.full(n, np.nan, dtype=np.float64))
+        avg_costs = np.fromiter((p[3] for p in app.positions), dtype=np.float64, count=n)
+        pos_sizes = np.fromiter((p[2] for p in app.positions), dtype=np.float64, count=n)
+        multipliers = np.fromiter((p[1]._mult for p in app.positions),
+                                  dtype=np.float64, count=n)
+        pnls = np.round((prices - avg_costs) * pos_sizes * multipliers, 2)
+
+        for i, (account, contract, pos, avgCost) in enumerate(app.positions):
+            has_price = not math.isnan(prices[i])
+            pos_rows.append([
+                account,
+                contract.symbol,
+                contract.secType,
+                pos,
+                avgCost,
+                round(prices[i], 2) if has_price else "N/A",
+                pnls[i] if has_price else "N/A"
+            ])
 
     if pos_rows:
         print("\nCurrent Positions:")
@@ -184,8 +217,11 @@ def main():
     else:
         print("\nNo account values received.")
 
+    # Unsubscribe and wait (briefly) for the ack instead of a fixed
+    # one-second sleep; disconnect as soon as it lands.
+    app.account_stop_event.clear()
     app.reqAccountUpdates(False, app.account_code if app.account_code else "")
-    time.sleep(1)
+    app.account_stop_event.wait(timeout=1)
     app.disconnect()
     print("\nDisconnected. Exiting.")
 
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 import logging
+import os
+import numpy as np
 import pandas as pd
 from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
 
 from managers.trade_manager import TradeManager
 from managers.entry_manager import EntryManager
@@ -18,6 +22,106 @@ from indicators.indicator_logic_ATR import calculate_ATR_series
 from utils.helpers import load_config
 from compute_trade_stats import compute_trade_stats
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+def _fused_indicators(high, low, close, ema_period, rsi_period, atr_period):
+    """
+    Single fused pass computing EMA, RSI, and ATR over the OHLC arrays.
+    One walk of the data instead of three keeps the price arrays in
+    cache; recurrences match ewm(span=..., adjust=False) like the
+    calculate_*_series functions. JIT-compiled when numba is installed.
+    """
+    n = close.shape[0]
+    ema = np.empty(n)
+    rsi = np.empty(n)
+    atr = np.empty(n)
+    if n == 0:
+        return ema, rsi, atr
+
+    alpha_ema = 2.0 / (ema_period + 1)
+    alpha_rsi = 2.0 / (rsi_period + 1)
+    alpha_atr = 2.0 / (atr_period + 1)
+
+    ema[0] = close[0]
+    rsi[0] = 50.0
+    atr[0] = high[0] - low[0]
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(1, n):
+        ema[i] = ema[i - 1] + alpha_ema * (close[i] - ema[i - 1])
+
+        delta = close[i] - close[i - 1]
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        avg_gain += alpha_rsi * (gain - avg_gain)
+        avg_loss += alpha_rsi * (loss - avg_loss)
+        if avg_loss > 0.0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0.0:
+            rsi[i] = 100.0
+        else:
+            rsi[i] = 50.0
+
+        tr = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+        atr[i] = atr[i - 1] + alpha_atr * (tr - atr[i - 1])
+
+    return ema, rsi, atr
+
+if numba is not None:
+    _fused_indicators = numba.njit(cache=True, fastmath=True)(_fused_indicators)
+
+class _StreamingIndicatorState:
+    """
+    O(1)-per-bar EMA/RSI/ATR state that can be carried across CSV chunks.
+    Uses the same ewm(span=..., adjust=False) recurrences as the
+    calculate_*_series functions, so a streamed run matches an in-memory one.
+    """
+    def __init__(self, ema_period=20, rsi_period=14, atr_period=14):
+        self.alpha_ema = 2.0 / (ema_period + 1)
+        self.alpha_rsi = 2.0 / (rsi_period + 1)
+        self.alpha_atr = 2.0 / (atr_period + 1)
+        self.ema = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.atr = None
+        self.prev_close = None
+
+    def update(self, high, low, close):
+        """Advance one bar; returns (ema, rsi, atr)."""
+        if self.ema is None:
+            self.ema = close
+            self.atr = high - low
+            self.prev_close = close
+            return self.ema, 50.0, self.atr
+
+        self.ema += self.alpha_ema * (close - self.ema)
+
+        delta = close - self.prev_close
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        self.avg_gain += self.alpha_rsi * (gain - self.avg_gain)
+        self.avg_loss += self.alpha_rsi * (loss - self.avg_loss)
+        if self.avg_loss > 0.0:
+            rsi = 100.0 - 100.0 / (1.0 + self.avg_gain / self.avg_loss)
+        else:
+            rsi = 100.0 if self.avg_gain > 0.0 else 50.0
+
+        tr = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.atr += self.alpha_atr * (tr - self.atr)
+
+        self.prev_close = close
+        return self.ema, rsi, self.atr
+
 class Backtester:
     def __init__(self, csv_file, trade_log_file="trade_log.csv"):
         self.csv_file = csv_file
@@ -50,8 +154,19 @@ class Backtester:
 
     def load_historical_csv(self):
         try:
-            df = pd.read_csv(self.csv_file)
-            df['time'] = pd.to_datetime(df['time'])
+            # Parse timestamps during the read (no second to_datetime pass)
+            # and keep OHLC in float32 — prices fit comfortably and the
+            # frame is half the size during the indicator passes. The
+            # multithreaded pyarrow parser is used when available.
+            read_kwargs = dict(
+                parse_dates=['time'],
+                dtype={'open': 'float32', 'high': 'float32',
+                       'low': 'float32', 'close': 'float32'},
+            )
+            try:
+                df = pd.read_csv(self.csv_file, engine='pyarrow', **read_kwargs)
+            except (ImportError, ValueError):
+                df = pd.read_csv(self.csv_file, **read_kwargs)
             df.sort_values('time', inplace=True)
             logging.info(f"Loaded {len(df)} rows from {self.csv_file}")
             return df
@@ -65,35 +180,143 @@ class Backtester:
             logging.warning("No data to backtest.")
             return
 
-        # 1) Compute a full series-based EMA, RSI, ATR 
-        df['ema20'] = calculate_EMA_series(df, price_col='close', period=20)
-        df['rsi14'] = calculate_RSI_series(df, price_col='close', period=14)
-        df['atr14'] = calculate_ATR_series(df, high_col='high', low_col='low', close_col='close', period=14)
+        # 1) Compute a full series-based EMA, RSI, ATR. With numba the
+        # three indicators come out of one fused pass over the arrays;
+        # otherwise fall back to the separate pandas-based series.
+        if numba is not None:
+            ema, rsi, atr = _fused_indicators(
+                df['high'].to_numpy(dtype=np.float64),
+                df['low'].to_numpy(dtype=np.float64),
+                df['close'].to_numpy(dtype=np.float64),
+                20, 14, 14)
+            df['ema20'] = ema
+            df['rsi14'] = rsi
+            df['atr14'] = atr
+        else:
+            df['ema20'] = calculate_EMA_series(df, price_col='close', period=20)
+            df['rsi14'] = calculate_RSI_series(df, price_col='close', period=14)
+            df['atr14'] = calculate_ATR_series(df, high_col='high', low_col='low', close_col='close', period=14)
 
         # OPTIONAL: Print a small sample
         print("\n[DEBUG] Sample rows with RSI/EMA/ATR:\n")
         print(df[['time','close','ema20','rsi14','atr14']].head(50))
 
-        # 2) Now iterate over each row, sending the correct indicators to trade_manager
-        for idx, row in df.iterrows():
-            bar_data = {
-                'time': row['time'],
-                'open': row['open'],
-                'high': row['high'],
-                'low': row['low'],
-                'close': row['close'],
-                'volume': row.get('volume', 0),
-            }
-            # Gather indicator values
-            indicators = {
-                'EMA': row['ema20'],
-                'RSI': row['rsi14'],
-                'ATR': row['atr14'],
-            }
+        # 2) Drive the managers from plain numpy arrays instead of iterrows().
+        # iterrows() materializes a Series (and boxes every scalar) per bar,
+        # which dominates runtime on long backtests. Pull each column out
+        # once, pre-compute which bars can even produce an entry signal
+        # (mirroring EntryManager's RSI/EMA rules), and reuse a single pair
+        # of dicts rather than allocating two fresh ones per bar.
+        # Read the thresholds off the EntryManager itself, not self.config:
+        # main.py --test rebinds backtester.config after construction (the
+        # parameter-sweep path), and the mask must mirror the manager it
+        # short-circuits.
+        rsi_overbought = self.entry_manager.rsi_overbought
+        rsi_oversold = self.entry_manager.rsi_oversold
+
+        times = df['time'].dt.to_pydatetime()
+        opens = df['open'].to_numpy()
+        highs = df['high'].to_numpy()
+        lows = df['low'].to_numpy()
+        closes = df['close'].to_numpy()
+        volumes = df['volume'].to_numpy() if 'volume' in df.columns else np.zeros(len(df))
+        emas = df['ema20'].to_numpy()
+        rsis = df['rsi14'].to_numpy()
+        atrs = df['atr14'].to_numpy()
+
+        entry_candidate = (((rsis < rsi_oversold) & (closes > emas)) |
+                           ((rsis > rsi_overbought) & (closes < emas)))
+
+        bar_data = {'time': None, 'open': 0.0, 'high': 0.0, 'low': 0.0,
+                    'close': 0.0, 'volume': 0}
+        indicators = {'EMA': 0.0, 'RSI': 0.0, 'ATR': 0.0}
+
+        for i in range(len(closes)):
+            # Flat and no possible entry this bar -> nothing for the
+            # managers to do; skip the dict updates entirely.
+            if self.trade_manager.current_position is None and not entry_candidate[i]:
+                continue
+            bar_data['time'] = times[i]
+            bar_data['open'] = opens[i]
+            bar_data['high'] = highs[i]
+            bar_data['low'] = lows[i]
+            bar_data['close'] = closes[i]
+            bar_data['volume'] = volumes[i]
+            indicators['EMA'] = emas[i]
+            indicators['RSI'] = rsis[i]
+            indicators['ATR'] = atrs[i]
             self.trade_manager.update(bar_data, indicators)
 
         logging.info("Backtest complete. You can review trades in `trade_record.text` ...")
-        compute_trade_stats(csv_path=self.trade_log_file, initial_capital=10000.0)
+        # Stats come straight from the in-memory trade records; the CSV
+        # remains on disk for later inspection but isn't re-parsed here.
+        compute_trade_stats(trades_df=self.trade_manager.trades_df, initial_capital=10000.0)
+
+    def run_backtest_streaming(self, chunksize=100_000):
+        """
+        Stream the CSV through the managers chunk-by-chunk instead of
+        loading it all. Indicator state carries across chunk boundaries
+        via _StreamingIndicatorState, so peak memory is O(chunksize)
+        regardless of file size — use this for multi-year tick exports
+        that don't fit in RAM. Assumes the CSV is already time-sorted
+        (a stream can't be re-sorted).
+        """
+        bar_data = {'time': None, 'open': 0.0, 'high': 0.0, 'low': 0.0,
+                    'close': 0.0, 'volume': 0}
+        indicators = {'EMA': 0.0, 'RSI': 0.0, 'ATR': 0.0}
+        state = _StreamingIndicatorState()
+        total_rows = 0
+
+        try:
+            reader = pd.read_csv(self.csv_file, parse_dates=['time'], chunksize=chunksize)
+            for chunk in reader:
+                times = chunk['time'].dt.to_pydatetime()
+                opens = chunk['open'].to_numpy()
+                highs = chunk['high'].to_numpy()
+                lows = chunk['low'].to_numpy()
+                closes = chunk['close'].to_numpy()
+                volumes = (chunk['volume'].to_numpy() if 'volume' in chunk.columns
+                           else np.zeros(len(chunk)))
+                total_rows += len(closes)
+
+                for i in range(len(closes)):
+                    ema, rsi, atr = state.update(highs[i], lows[i], closes[i])
+                    bar_data['time'] = times[i]
+                    bar_data['open'] = opens[i]
+                    bar_data['high'] = highs[i]
+                    bar_data['low'] = lows[i]
+                    bar_data['close'] = closes[i]
+                    bar_data['volume'] = volumes[i]
+                    indicators['EMA'] = ema
+                    indicators['RSI'] = rsi
+                    indicators['ATR'] = atr
+                    self.trade_manager.update(bar_data, indicators)
+        except Exception as e:
+            logging.error(f"Streaming backtest failed on {self.csv_file}: {e}")
+            return
+
+        if total_rows == 0:
+            logging.warning("No data to backtest.")
+            return
+
+        logging.info("Backtest complete. You can review trades in `trade_record.text` ...")
+        compute_trade_stats(trades_df=self.trade_manager.trades_df, initial_capital=10000.0)
+
+def _run_one(csv_file):
+    """Worker for run_many: one Backtester per CSV with its own trade log."""
+    Backtester(csv_file, trade_log_file=f"trade_log_{Path(csv_file).stem}.csv").run_backtest()
+
+def run_many(csv_files, processes=None):
+    """
+    Run one backtest per CSV file in parallel worker processes.
+
+    The indicator math and bar loop are CPU-bound, so separate processes
+    sidestep the GIL and scale with core count. The 'spawn' context is
+    used for fork-safety with pandas on macOS/Windows.
+    """
+    ctx = get_context("spawn")
+    with ctx.Pool(processes or os.cpu_count()) as pool:
+        pool.map(_run_one, csv_files)
 
 if __name__ == "__main__":
     # Replace "your_csv_file.csv" with the actual CSV path when running interactively.
@@ -1,55 +1,93 @@
 # File: compute_trade_stats.py
+import numpy as np
 import pandas as pd
 import math
 
-def compute_trade_stats(csv_path="trade_log.csv", initial_capital=10000.0):
+def compute_trade_stats(csv_path="trade_log.csv", initial_capital=10000.0, trades_df=None):
     """
     Reads trades from 'trade_log.csv' and computes overall stats plus separate LONG/SHORT stats.
     Also does a running equity simulation to find net profit, drawdown, etc.
+
+    If 'trades_df' is provided (e.g. straight from TradeManager after a
+    backtest), it is used directly and the CSV round-trip is skipped.
     """
-    try:
-        df = pd.read_csv(csv_path)
-    except FileNotFoundError:
-        print(f"No trades found: {csv_path} does not exist.")
-        return
+    if trades_df is not None:
+        df = trades_df
+    else:
+        try:
+            # Only materialize the columns the stats actually use, in the
+            # dtype they are used as ('Side' as category makes the side
+            # comparisons dictionary lookups rather than string equality).
+            wanted = ["Trade #", "Side", "P/L", "Entry Bar", "Exit Bar"]
+            header = pd.read_csv(csv_path, nrows=0).columns
+            df = pd.read_csv(csv_path,
+                             usecols=[c for c in wanted if c in header],
+                             dtype={"Trade #": "int64", "Side": "category",
+                                    "P/L": "float64"})
+        except FileNotFoundError:
+            print(f"No trades found: {csv_path} does not exist.")
+            return
 
     # Check if the CSV contains a "Side" column
     if "Side" not in df.columns:
         print("No 'Side' column found; can't separate LONG vs SHORT. Please ensure your CSV has this column.")
         return
 
-    # Convert P/L to float (if necessary)
-    df["P/L"] = pd.to_numeric(df["P/L"], errors="coerce").fillna(0.0)
+    # Coerce P/L to float only when it isn't already (in-memory frames).
+    if df["P/L"].dtype != np.float64:
+        df["P/L"] = pd.to_numeric(df["P/L"], errors="coerce").fillna(0.0)
 
     # If you have 'Entry Bar' / 'Exit Bar' columns, compute bar counts.
     if "Entry Bar" in df.columns and "Exit Bar" in df.columns:
         df["bar_count"] = df["Exit Bar"] - df["Entry Bar"]
 
     # A) QUICK AGGREGATES
-    overall_stats = _compute_subset_stats(df, label="ALL")
-    long_df = df[df["Side"] == "LONG"]
-    long_stats = _compute_subset_stats(long_df, label="LONG")
-    short_df = df[df["Side"] == "SHORT"]
-    short_stats = _compute_subset_stats(short_df, label="SHORT")
+    # Pull P/L and Side out once; each subset is a masked view of the
+    # same array, so no DataFrame copies and no repeated column scans.
+    # Lazy import keeps startup cheap; running_peak_dd is None without numba.
+    from perf.drawdown_kernel import running_peak_dd
+
+    pl_all = df["P/L"].to_numpy(dtype=np.float64)
+    side_arr = df["Side"].to_numpy()
+    bar_counts = (df["bar_count"].to_numpy(dtype=np.float64)
+                  if "bar_count" in df.columns else None)
+
+    long_mask = side_arr == "LONG"
+    short_mask = side_arr == "SHORT"
+    overall_stats = _stats_from_pl(pl_all, label="ALL", bar_counts=bar_counts)
+    long_stats = _stats_from_pl(pl_all[long_mask], label="LONG",
+                                bar_counts=bar_counts[long_mask] if bar_counts is not None else None)
+    short_stats = _stats_from_pl(pl_all[short_mask], label="SHORT",
+                                 bar_counts=bar_counts[short_mask] if bar_counts is not None else None)
 
     # B) RUNNING EQUITY & DRAWDOWN
-    df = df.sort_values(by="Trade #")
-    equity = initial_capital
-    max_equity = initial_capital
-    min_equity = initial_capital
-    equity_curve = [initial_capital]
-
-    for idx, row in df.iterrows():
-        equity += row["P/L"]
-        equity_curve.append(equity)
-        if equity > max_equity:
-            max_equity = equity
-        if equity < min_equity:
-            min_equity = equity
+    # The equity walk is a prefix sum over P/L in trade order. Only that
+    # one column needs ordering, so argsort the trade ids and take from
+    # the P/L array extracted above instead of sorting the whole frame.
+    if "Trade #" in df.columns:
+        order = np.argsort(df["Trade #"].to_numpy(), kind="stable")
+        pnl = np.take(pl_all, order)
+    else:
+        pnl = pl_all
+    if running_peak_dd is not None:
+        # One fused JIT pass gives equity, running peak, and drawdown
+        # with a single sweep of the array.
+        equity, max_equity, max_drawdown = running_peak_dd(pnl, initial_capital)
+    else:
+        equity_curve = np.empty(len(pnl) + 1)
+        equity_curve[0] = initial_capital
+        np.cumsum(pnl, out=equity_curve[1:])
+        equity_curve[1:] += initial_capital
+
+        equity = float(equity_curve[-1])
+        max_equity = float(equity_curve.max())
+        # Standard peak-to-trough drawdown: distance from the running peak,
+        # not from initial capital (which under-reports after a run-up).
+        peaks = np.maximum.accumulate(equity_curve)
+        max_drawdown = float((peaks - equity_curve).max())
 
     net_profit = equity - initial_capital
     max_runup = max_equity - initial_capital
-    max_drawdown = initial_capital - min_equity
 
     # PRINT A SUMMARY
     print("----- TRADE STATS SUMMARY -----")
@@ -64,14 +102,17 @@ def compute_trade_stats(csv_path="trade_log.csv", initial_capital=10000.0):
     for subset_stats in [overall_stats, long_stats, short_stats]:
         _pretty_print_stats(subset_stats)
 
-def _compute_subset_stats(df, label="ALL"):
+def _stats_from_pl(pl, label="ALL", bar_counts=None):
     """
-    Given a subset of trades (all, long, short), compute various metrics:
+    Given a subset's P/L array (all, long, short), compute various metrics:
       - total trades, winners, losers, win rate, average P/L, largest win/loss,
       - ratio of avg win to avg loss, average bar count, etc.
+    The win/loss masks are built once and every aggregate indexes them,
+    so there are no DataFrame copies and no repeated column scans.
     Returns a dictionary with these values.
     """
-    if len(df) == 0:
+    total_trades = int(pl.size)
+    if total_trades == 0:
         return {
             "label": label,
             "total_trades": 0,
@@ -88,32 +129,30 @@ def _compute_subset_stats(df, label="ALL"):
             "avg_bar_count": None,
         }
 
-    total_trades = len(df)
-    winners = df[df["P/L"] > 0]
-    losers  = df[df["P/L"] < 0]
-    winning_trades = len(winners)
-    losing_trades  = len(losers)
+    wins = pl[pl > 0]
+    losses = pl[pl < 0]
+    winning_trades = int(wins.size)
+    losing_trades = int(losses.size)
     win_rate = 100.0 * winning_trades / total_trades
 
-    avg_pl = df["P/L"].mean()
-    largest_win = winners["P/L"].max() if not winners.empty else 0.0
-    largest_loss = losers["P/L"].min() if not losers.empty else 0.0
-    largest_loss = abs(largest_loss)
+    avg_pl = float(pl.mean())
+    largest_win = float(wins.max()) if winning_trades else 0.0
+    largest_loss = abs(float(losses.min())) if losing_trades else 0.0
 
-    sum_wins = winners["P/L"].sum()
-    sum_losses = losers["P/L"].sum()
+    sum_wins = float(wins.sum())
+    sum_losses = float(losses.sum())
     profit_factor = 0.0
     if sum_losses != 0:
         profit_factor = sum_wins / abs(sum_losses)
 
-    avg_win_val = winners["P/L"].mean() if not winners.empty else 0.0
-    avg_loss_val = losers["P/L"].mean() if not losers.empty else 0.0
+    avg_win_val = float(wins.mean()) if winning_trades else 0.0
+    avg_loss_val = float(losses.mean()) if losing_trades else 0.0
     ratio_avg_win_loss = 0.0
     if avg_loss_val != 0:
         ratio_avg_win_loss = avg_win_val / abs(avg_loss_val)
 
-    if "bar_count" in df.columns:
-        avg_bars = df["bar_count"].mean()
+    if bar_counts is not None and bar_counts.size:
+        avg_bars = float(bar_counts.mean())
     else:
         avg_bars = None
 
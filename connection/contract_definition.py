@@ -1,11 +1,31 @@
 # File: /home/student/MES/connection/contract_definition.py
 
+import copy
+import functools
 import logging
 try:
     from ibapi.contract import Contract
 except ImportError:
     Contract = None
 
+@functools.lru_cache(maxsize=256)
+def _contract_prototype(symbol, sec_type, exchange, currency,
+                        last_trade_date, local_symbol, multiplier):
+    """Build and memoize a fully-populated prototype Contract."""
+    contract = Contract()
+    contract.symbol = symbol
+    contract.secType = sec_type
+    contract.exchange = exchange
+    contract.currency = currency
+
+    if last_trade_date:
+        contract.lastTradeDateOrContractMonth = last_trade_date
+    if local_symbol:
+        contract.localSymbol = local_symbol
+    if multiplier:
+        contract.multiplier = multiplier
+    return contract
+
 def create_contract(symbol: str,
                     sec_type: str,
                     exchange: str,
@@ -15,6 +35,10 @@ def create_contract(symbol: str,
                     multiplier: str = None):
     """
     Create and return an Interactive Brokers Contract object.
+    Prototypes are cached per field tuple and shallow-copied on the way
+    out, so repeat requests (e.g. scanning strikes/expiries in a loop)
+    skip the attribute assignments while callers still get a mutable
+    per-request object.
     """
     if Contract is None:
         logging.warning("IB API is not available. Returning contract info as dict.")
@@ -28,18 +52,6 @@ def create_contract(symbol: str,
             "multiplier": multiplier
         }
 
-    contract = Contract()
-    contract.symbol = symbol
-    contract.secType = sec_type
-    contract.exchange = exchange
-    contract.currency = currency
-
-    if last_trade_date:
-        contract.lastTradeDateOrContractMonth = last_trade_date
-    if local_symbol:
-        contract.localSymbol = local_symbol
-    if multiplier:
-        contract.multiplier = multiplier
-
-    logging.info(f"Contract created: {symbol} {sec_type} on {exchange} in {currency}")
-    return contract
+    logging.debug("Contract created: %s %s on %s in %s", symbol, sec_type, exchange, currency)
+    return copy.copy(_contract_prototype(symbol, sec_type, exchange, currency,
+                                         last_trade_date, local_symbol, multiplier))
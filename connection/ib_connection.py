@@ -1,8 +1,9 @@
 # File: /home/student/MES/connection/ib_connection.py
 
+import array
+import calendar
 import logging
 import threading
-from datetime import datetime
 
 try:
     from ibapi.client import EClient
@@ -12,6 +13,21 @@ except ImportError:
     EClient = object
     EWrapper = object
 
+# Status codes IB reports through the error callback that are really
+# just data-farm connectivity notices.
+_INFO_CODES = frozenset({2100, 2104, 2106, 2107, 2119, 2158})
+
+def _parse_intraday_epoch(s):
+    """'YYYYMMDD  HH:MM:SS' -> epoch seconds by integer slicing."""
+    return calendar.timegm((int(s[0:4]), int(s[4:6]), int(s[6:8]),
+                            int(s[10:12]), int(s[13:15]), int(s[16:18]),
+                            0, 0, 0))
+
+def _parse_daily_epoch(s):
+    """'YYYYMMDD' -> epoch seconds (midnight UTC)."""
+    return calendar.timegm((int(s[0:4]), int(s[4:6]), int(s[6:8]),
+                            0, 0, 0, 0, 0, 0))
+
 class IBApi(EWrapper, EClient):
     """
     IBApi combines EWrapper and EClient to interact with IB TWS/Gateway.
@@ -21,10 +37,34 @@ class IBApi(EWrapper, EClient):
         EClient.__init__(self, self)
         self.nextOrderId = None
 
-        # Store historical data results here
-        self._historical_data = []
+        # Historical bars are stored column-wise (struct-of-arrays): six
+        # typed arrays instead of one dict per bar, so consumers can hand
+        # whole columns to numpy/pandas without a per-bar Python hop.
+        # 'time' holds int64 epoch seconds.
+        self._historical_data = self._new_historical_columns()
         # Event used to signal that the historical data download is done
         self._historical_data_done = threading.Event()
+        # Date parser chosen once from the first bar's format; all bars
+        # of a request share the same format.
+        self._date_parser = None
+
+    @staticmethod
+    def _new_historical_columns():
+        return {
+            "time": array.array("q"),
+            "open": array.array("d"),
+            "high": array.array("d"),
+            "low": array.array("d"),
+            "close": array.array("d"),
+            "volume": array.array("q"),
+        }
+
+    def reset_historical_data(self):
+        """Drop any previously downloaded bars before a new request."""
+        self._historical_data = self._new_historical_columns()
+        self._historical_data_done.clear()
+        # The next request may use a different bar size/date format.
+        self._date_parser = None
 
     def nextValidId(self, orderId: int):
         super().nextValidId(orderId)
@@ -32,8 +72,11 @@ class IBApi(EWrapper, EClient):
         logging.info(f"Received next valid Order ID: {orderId}")
 
     def error(self, reqId, errorCode, errorString):
-        # Some IB "error" codes are actually just info messages about data farms, etc.
-        logging.error(f"IB Error {errorCode} (reqId {reqId}): {errorString}")
+        # Some IB "error" codes are actually just info messages about data
+        # farms, etc. — skip those before any record is formatted.
+        if errorCode in _INFO_CODES:
+            return
+        logging.error("IB Error %d (reqId %s): %s", errorCode, reqId, errorString)
 
     # -------------------------------------------------------------------------
     # Historical Data Callbacks
@@ -44,23 +87,23 @@ class IBApi(EWrapper, EClient):
         'bar' is an object of type BarData with fields:
             date, open, high, low, close, volume, barCount, WAP
         """
-        # Convert the bar to a dictionary
-        try:
-            bar_time = datetime.strptime(bar.date, "%Y%m%d  %H:%M:%S")
-        except ValueError:
-            # Sometimes IB returns a date like '20230615', meaning daily or larger timeframe
-            # If you need intraday bars, it should return "YYYYMMDD HH:MM:SS".
-            bar_time = datetime.strptime(bar.date, "%Y%m%d")
-
-        bar_dict = {
-            "time": bar_time,
-            "open": bar.open,
-            "high": bar.high,
-            "low": bar.low,
-            "close": bar.close,
-            "volume": bar.volume
-        }
-        self._historical_data.append(bar_dict)
+        # Probe the stamp format once ('YYYYMMDD  HH:MM:SS' intraday vs
+        # 'YYYYMMDD' for daily and larger timeframes); after that every
+        # bar takes the branch-free integer-slicing parser instead of a
+        # strptime format walk plus exception fallback.
+        if self._date_parser is None:
+            self._date_parser = (_parse_intraday_epoch if len(bar.date) > 8
+                                 else _parse_daily_epoch)
+
+        # Append each field to its column; consumers rebuild datetimes in
+        # one vectorized pd.to_datetime(..., unit="s") call.
+        cols = self._historical_data
+        cols["time"].append(self._date_parser(bar.date))
+        cols["open"].append(bar.open)
+        cols["high"].append(bar.high)
+        cols["low"].append(bar.low)
+        cols["close"].append(bar.close)
+        cols["volume"].append(int(bar.volume))
 
     def historicalDataEnd(self, reqId, start, end):
         """
@@ -68,7 +111,7 @@ class IBApi(EWrapper, EClient):
         """
         logging.info(
             f"Historical data download complete. "
-            f"Received {len(self._historical_data)} bars."
+            f"Received {len(self._historical_data['time'])} bars."
         )
         # Signal that the data is done
         self._historical_data_done.set()
@@ -87,14 +130,19 @@ class IBConnection:
         self.thread = threading.Thread(target=self.app.run, daemon=True)
         self.thread.start()
 
+        # Resolve the hot-path callables once; whether they exist is
+        # fixed at class-load time (real EClient vs. the object
+        # fallback), so no reflection per order.
+        self._is_connected_fn = getattr(self.app, "isConnected", None) or (lambda: False)
+        self._place_order_fn = getattr(self.app, "placeOrder", None)
+        self._next_id_lock = threading.Lock()
+
         # Wait a short time for connection to establish
         logging.info("IB connection thread started.")
 
     def is_connected(self) -> bool:
         """Check if the IB connection is established."""
-        if hasattr(self.app, "isConnected"):
-            return self.app.isConnected()
-        return False
+        return self._is_connected_fn()
 
     def disconnect(self):
         """Disconnect from IB."""
@@ -109,17 +157,56 @@ class IBConnection:
         """
         Place an order via the IB API. Expects an IB contract and order object.
         """
-        if not self.is_connected():
+        if not self._is_connected_fn() or self._place_order_fn is None:
             logging.error("Cannot place order: not connected to IB.")
             return
-        # Ensure we have a valid order ID
-        if hasattr(self.app, "nextOrderId") and self.app.nextOrderId is not None:
-            order_id = self.app.nextOrderId
-            self.app.nextOrderId += 1  # increment for next order
-        else:
-            order_id = 1  # fallback order id
+        # Allocate the order ID under a lock; the bare increment races
+        # when several strategy threads fire orders concurrently.
+        with self._next_id_lock:
+            if self.app.nextOrderId is not None:
+                order_id = self.app.nextOrderId
+                self.app.nextOrderId += 1  # increment for next order
+            else:
+                order_id = 1  # fallback order id
         logging.info(f"Placing order {order_id}: {order}")
         try:
-            self.app.placeOrder(order_id, contract, order)
+            self._place_order_fn(order_id, contract, order)
         except Exception as e:
             logging.exception(f"Order placement failed: {e}")
+
+    def place_bracket_order(self, contract, parent, children):
+        """
+        Place a parent order plus its protective children (stop-loss /
+        take-profit) as one bracket.
+
+        Every order except the last is sent with transmit=False, so TWS
+        buffers the group and activates it atomically when the final
+        child arrives with transmit=True. Compared to three independent
+        place_order round-trips this saves two request/ack cycles and
+        closes the window where the entry is live without its stop; the
+        parentId link also gives exchange-side OCO semantics between the
+        children.
+        """
+        if not self._is_connected_fn() or self._place_order_fn is None:
+            logging.error("Cannot place bracket order: not connected to IB.")
+            return
+        orders = [parent] + list(children)
+        # Allocate consecutive IDs for the whole group in one locked step.
+        with self._next_id_lock:
+            if self.app.nextOrderId is not None:
+                parent_id = self.app.nextOrderId
+                self.app.nextOrderId += len(orders)
+            else:
+                parent_id = 1
+        for child in children:
+            child.parentId = parent_id
+        for order in orders:
+            order.transmit = False
+        orders[-1].transmit = True
+        logging.info(f"Placing bracket order {parent_id} "
+                     f"({len(children)} child orders): {parent}")
+        try:
+            for offset, order in enumerate(orders):
+                self._place_order_fn(parent_id + offset, contract, order)
+        except Exception as e:
+            logging.exception(f"Bracket order placement failed: {e}")
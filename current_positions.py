@@ -17,19 +17,25 @@ def load_positions_from_csv():
 def update_positions_table(positions):
     """Display the positions in a dynamically updating table."""
     console = Console()
+
+    # The DataFrame is static, so stringify it once up front; each
+    # refresh then just replays the pre-rendered tuples instead of
+    # re-walking the frame with iterrows.
+    columns = ["Financial Instrument", "Symbol", "Last", "Daily P&L", "Unrealized P&L"]
+    rendered_rows = list(zip(*[positions[col].astype(str).to_numpy() for col in columns]))
+
     while True:
         console.clear()
         table = Table(title="TWS Positions")
-        
+
         # Adding selected columns
-        columns = ["Financial Instrument", "Symbol", "Last", "Daily P&L", "Unrealized P&L"]
         for col in columns:
             table.add_column(col, justify="right")
-        
+
         # Adding rows
-        for _, row in positions.iterrows():
-            table.add_row(*[str(row[col]) for col in columns])
-        
+        for row in rendered_rows:
+            table.add_row(*row)
+
         console.print(table)
         time.sleep(2)  # Refresh interval
 
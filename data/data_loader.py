@@ -1,9 +1,12 @@
 # File: /home/student/MES/data/data_loader.py
 
 import logging
-from datetime import datetime, timezone
 import time
 
+import numpy as np
+
+_LOG = logging.getLogger(__name__)
+
 class DataLoader:
     """
     Responsible for loading historical market data required for indicators and strategy.
@@ -15,24 +18,29 @@ class DataLoader:
     def fetch_historical_data(self, days: int, bar_size: str):
         """
         Fetch real OHLCV data from IB for the specified number of days and bar size.
-        Returns data as a list of dict bars: [{'time', 'open', 'high', 'low', 'close', 'volume'}, ...]
+        Returns data column-wise as a dict of numpy arrays:
+        {'time', 'open', 'high', 'low', 'close', 'volume'}, with 'time'
+        as int64 epoch seconds (pd.to_datetime(arr, unit='s') rebuilds
+        timestamps in one call).
         """
         if not self.ib.is_connected():
-            logging.error("Not connected to IB; cannot fetch historical data.")
-            return []
+            _LOG.error("Not connected to IB; cannot fetch historical data.")
+            return {}
 
         # Clear old data from the IBApi object
-        self.ib.app._historical_data = []
-        self.ib.app._historical_data_done.clear()
+        self.ib.app.reset_historical_data()
 
         # Use IB's recommended date-time format with explicit time zone, e.g. UTC
         # Format: YYYYMMDD-HH:MM:SS <TIMEZONE>
-        end_time = datetime.now(timezone.utc).strftime("%Y%m%d-%H:%M:%S")
+        # time.gmtime avoids the datetime/tzinfo allocation of
+        # datetime.now(timezone.utc) when a live loop polls this.
+        end_time = time.strftime("%Y%m%d-%H:%M:%S", time.gmtime())
 
         duration = f"{days} D"  # e.g. "1 D" for 1 day
 
-        logging.info(f"Requesting real historical data: last {days} day(s), bar size = {bar_size}")
-        logging.info(f"Using endDateTime = {end_time} (UTC)")
+        if _LOG.isEnabledFor(logging.INFO):
+            _LOG.info(f"Requesting real historical data: last {days} day(s), bar size = {bar_size}")
+            _LOG.info(f"Using endDateTime = {end_time} (UTC)")
 
         try:
             self.ib.app.reqHistoricalData(
@@ -48,19 +56,24 @@ class DataLoader:
                 chartOptions=[]
             )
         except Exception as e:
-            logging.error(f"Historical data request failed: {e}")
-            return []
+            _LOG.error(f"Historical data request failed: {e}")
+            return {}
 
         # Wait up to 30 seconds for the data to arrive
         wait_seconds = 30
-        logging.info(f"Waiting up to {wait_seconds}s for historical data to complete...")
+        if _LOG.isEnabledFor(logging.INFO):
+            _LOG.info(f"Waiting up to {wait_seconds}s for historical data to complete...")
         finished = self.ib.app._historical_data_done.wait(timeout=wait_seconds)
 
         if not finished:
-            logging.warning("Timeout waiting for historical data. Returning partial data.")
-        else:
-            logging.info("Historical data download signaled complete.")
+            _LOG.warning("Timeout waiting for historical data. Returning partial data.")
+        elif _LOG.isEnabledFor(logging.INFO):
+            _LOG.info("Historical data download signaled complete.")
 
-        data = self.ib.app._historical_data
-        logging.info(f"Fetched {len(data)} bars from IB.")
+        # Wrap the typed columns as numpy arrays (buffer-backed, no
+        # per-bar copies) before handing them to callers.
+        data = {name: np.frombuffer(col, dtype=np.int64 if col.typecode == "q" else np.float64)
+                for name, col in self.ib.app._historical_data.items()}
+        if _LOG.isEnabledFor(logging.INFO):
+            _LOG.info(f"Fetched {len(data['time'])} bars from IB.")
         return data
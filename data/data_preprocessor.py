@@ -1,5 +1,8 @@
 import logging
 
+import numpy as np
+import pandas as pd
+
 class DataPreprocessor:
     """
     Handles preprocessing of raw data into a format suitable for indicator calculations and strategy logic.
@@ -11,13 +14,27 @@ class DataPreprocessor:
         """
         Perform any necessary preprocessing on raw data.
         For example: sorting data by time, handling missing values, etc.
-        Returns processed data (e.g., list of bar dictionaries).
+        Accepts either the columnar dict-of-arrays the loader returns or
+        the legacy list of bar dicts, and returns the same shape it was
+        given, sorted by time.
         """
         if not raw_data:
             logging.warning("No data to preprocess.")
-            return []
-        # Sort data by timestamp if not already sorted
-        data = sorted(raw_data, key=lambda x: x.get("time", 0))
+            return raw_data if isinstance(raw_data, dict) else []
+
+        if isinstance(raw_data, dict):
+            # Columnar data: one C-level argsort on the time column and a
+            # take per column, instead of a Python keyfunc per element.
+            order = np.argsort(np.asarray(raw_data["time"]), kind="stable")
+            data = {k: np.take(np.asarray(v), order) for k, v in raw_data.items()}
+            count = order.size
+        else:
+            # Legacy list of bar dicts: a single frame sort still beats
+            # sorted() with a per-dict key lambda.
+            df = pd.DataFrame(raw_data).sort_values("time", kind="stable")
+            data = df.to_dict("records")
+            count = len(data)
+
         # Potentially handle missing data or outliers here (not implemented for simplicity)
-        logging.info(f"Preprocessed {len(data)} data points.")
+        logging.info(f"Preprocessed {count} data points.")
         return data
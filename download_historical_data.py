@@ -5,17 +5,21 @@ download_historical_bars_parallel_limited.py
 
 - Loads IB connection details + contract details from config.yaml
 - Splits the total requested days (e.g. 29) into smaller "chunks" (e.g. 9-10 days each).
-- Fetches them in parallel with up to N=6 simultaneous connections.
-- Waits 0.3s after launching each thread to stagger the connections.
-- Each thread uses a unique clientId so IB sees them as distinct connections.
+- Fetches them over ONE persistent connection, multiplexed by reqId,
+  with up to N requests in flight at a time; a new chunk starts as soon
+  as any running one finishes.
 - Collects the bars in chronological order, then writes them to CSV.
 """
 
-import csv
+import array
 import logging
-import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
-from threading import Thread, Event
+from threading import Thread
+
+import pandas as pd
 
 from utils.helpers import load_config  # your config loader
 
@@ -24,135 +28,150 @@ from ibapi.wrapper import EWrapper
 from ibapi.contract import Contract
 
 
+def _new_chunk_columns():
+    # Bars are stored column-wise: one typed array per field instead of
+    # a six-key dict per bar (~48 B/bar rather than ~300 B). The time
+    # strings stay raw; main() parses them in one vectorized pass.
+    return {
+        "time": [],
+        "open": array.array("d"),
+        "high": array.array("d"),
+        "low": array.array("d"),
+        "close": array.array("d"),
+        "volume": array.array("q"),
+    }
+
+
 # ---------------------------------------------------------------------------
 #   1) IB App Class
 # ---------------------------------------------------------------------------
 class HistDataApp(EWrapper, EClient):
+    """
+    One persistent TWS connection shared by all chunks. The TWS login
+    handshake costs a few hundred ms, so connecting once instead of once
+    per chunk saves ~10-20 s over a 40-chunk download; concurrent chunk
+    requests are multiplexed on the socket and routed by reqId.
+    """
     def __init__(self):
         EClient.__init__(self, self)
-        self.bars = []       # store downloaded bars
-        self.done = Event()  # signals when historicalDataEnd is received
+        self._lock = threading.Lock()
+        self._columns = {}  # reqId -> column dict being filled
+        self._queues = {}   # reqId -> queue delivering the finished columns
+
+    def register_request(self, req_id):
+        """Set up routing for a chunk; returns its completion queue."""
+        done = queue.SimpleQueue()
+        with self._lock:
+            self._columns[req_id] = _new_chunk_columns()
+            self._queues[req_id] = done
+        return done
+
+    def columns_for(self, req_id):
+        return self._columns.get(req_id)
 
     def error(self, reqId, errorCode, errorString):
         # ignore common "warning" codes for data-farm connection statuses
         if errorCode not in (2104, 2106, 2158):
-            logging.error(f"[ERROR] ID={reqId} Code={errorCode} Msg={errorString}")
+            logging.error("[ERROR] ID=%s Code=%s Msg=%s", reqId, errorCode, errorString)
 
     def historicalData(self, reqId, bar):
-        row = {
-            "time":   bar.date,
-            "open":   bar.open,
-            "high":   bar.high,
-            "low":    bar.low,
-            "close":  bar.close,
-            "volume": bar.volume
-        }
-        self.bars.append(row)
+        cols = self._columns[reqId]
+        cols["time"].append(bar.date)
+        cols["open"].append(bar.open)
+        cols["high"].append(bar.high)
+        cols["low"].append(bar.low)
+        cols["close"].append(bar.close)
+        cols["volume"].append(int(bar.volume))
 
     def historicalDataEnd(self, reqId, start, end):
-        logging.info(f"Thread {self._threadName}: Completed download: {len(self.bars)} bars.")
-        self.done.set()
+        logging.info(f"Req {reqId}: Completed download: "
+                     f"{len(self._columns[reqId]['time'])} bars.")
+        # The handoff itself is the completion barrier.
+        self._queues[reqId].put(self._columns[reqId])
 
 
 # ---------------------------------------------------------------------------
 #   2) Worker function for a single chunk
 # ---------------------------------------------------------------------------
-def fetch_chunk_in_thread(thread_id, host, port, contract, endDateTime, durationStr, bar_size,
-                          what_to_show, useRTH, formatDate, timeout, results_dict):
-    """
-    Connects to TWS/IB Gateway with a unique clientId, requests this chunk,
-    waits up to `timeout` seconds, then stores the bars in results_dict[thread_id].
+def fetch_chunk_in_thread(app, req_id, contract, endDateTime, durationStr, bar_size,
+                          what_to_show, useRTH, formatDate, timeout, results_dict, sem):
     """
-    app = HistDataApp()
-    app._threadName = f"T{thread_id}"  # just for logging
-
-    # unique clientId for each thread
-    client_id = 100 + thread_id
-
-    logging.info(f"[Thread {thread_id}] Connecting to IB @ {host}:{port}, clientId={client_id}")
-    app.connect(host, port, client_id)
-
-    api_thread = Thread(target=app.run, daemon=True)
-    api_thread.start()
-
-    # request data
-    req_id = thread_id
-    logging.info(f"[Thread {thread_id}] Request: {durationStr} of {bar_size} ending='{endDateTime}'")
-    app.reqHistoricalData(
-        reqId=req_id,
-        contract=contract,
-        endDateTime=endDateTime,
-        durationStr=durationStr,
-        barSizeSetting=bar_size,
-        whatToShow=what_to_show,
-        useRTH=useRTH,
-        formatDate=formatDate,
-        keepUpToDate=False,
-        chartOptions=[]
-    )
-
-    # wait for the chunk to finish
-    finished = app.done.wait(timeout=timeout)
-    if not finished:
-        logging.warning(f"[Thread {thread_id}] Timeout waiting for historical data.")
-
-    # short delay to ensure all bars are received
-    time.sleep(1)
-
-    # disconnect
-    if app.isConnected():
-        app.disconnect()
-
-    # store results
-    results_dict[thread_id] = app.bars[:]
+    Requests this chunk over the shared connection, waits up to `timeout`
+    seconds, then stores the columns in results_dict[req_id].
 
-
-# ---------------------------------------------------------------------------
-#   3) Helper to parse IB date strings -> Python datetime
-# ---------------------------------------------------------------------------
-def parse_ib_datetime(ib_date_str):
-    """
-    If 'YYYYMMDD' -> daily bar
-    If 'YYYYMMDD  HH:MM:SS' -> intraday bar
-    (No timezone info in the bars themselves, so no tz parse.)
+    `sem` bounds how many requests are in flight at once (IB caps open
+    historical-data requests); it is released in the finally block so the
+    executor can keep every slot busy.
     """
-    if len(ib_date_str) == 8:
-        return datetime.strptime(ib_date_str, "%Y%m%d")
-    else:
-        return datetime.strptime(ib_date_str, "%Y%m%d  %H:%M:%S")
+    sem.acquire()
+    try:
+        done = app.register_request(req_id)
+        logging.info(f"[Req {req_id}] Request: {durationStr} of {bar_size} ending='{endDateTime}'")
+        app.reqHistoricalData(
+            reqId=req_id,
+            contract=contract,
+            endDateTime=endDateTime,
+            durationStr=durationStr,
+            barSizeSetting=bar_size,
+            whatToShow=what_to_show,
+            useRTH=useRTH,
+            formatDate=formatDate,
+            keepUpToDate=False,
+            chartOptions=[]
+        )
+
+        # wait for the chunk to finish: historicalDataEnd arrives after
+        # the last bar, so receiving the columns through the queue means
+        # nothing for this reqId is still in flight
+        try:
+            columns = done.get(timeout=timeout)
+        except queue.Empty:
+            logging.warning(f"[Req {req_id}] Timeout waiting for historical data.")
+            columns = app.columns_for(req_id)  # keep whatever bars did arrive
+
+        results_dict[req_id] = columns
+    finally:
+        sem.release()
 
 
 # ---------------------------------------------------------------------------
-#   4) Generate chunk definitions
+#   3) Generate chunk definitions
 # ---------------------------------------------------------------------------
 def compute_chunk_info(total_days, chunk_size):
     """
     Return a list of (chunkIndex, endDate, durationStr).
     We break total_days into chunks of chunk_size, each with
     an explicit UTC timestamp in 'YYYYMMDD HH:MM:SS UTC' format.
+
+    Each chunk's end time steps back by the days actually consumed so
+    far (not index * chunk_size), so the windows tile the total span
+    exactly even if chunk sizes ever vary — no re-downloading of a
+    window already covered by an earlier chunk.
     """
     # Make 'now' in UTC to ensure we're labeling times correctly.
     now_utc = datetime.now(timezone.utc)
     chunk_info_list = []
 
-    chunk_count = (total_days + chunk_size - 1) // chunk_size  # ceil division
-    for i in range(chunk_count):
+    end_dt_utc = now_utc
+    remaining = total_days
+    idx = 0
+    while remaining > 0:
         # how many days for this chunk
-        days_for_this_chunk = min(chunk_size, total_days - i * chunk_size)
+        days_for_this_chunk = min(chunk_size, remaining)
 
-        # Compute chunk end time in UTC
-        end_dt_utc = now_utc - timedelta(days=i * chunk_size)
         # Format with explicit 'UTC' suffix to comply with IB's recommended format
         end_date_str = end_dt_utc.strftime("%Y%m%d %H:%M:%S UTC")
+        chunk_info_list.append((idx, end_date_str, f"{days_for_this_chunk} D"))
 
-        duration_str = f"{days_for_this_chunk} D"
-        chunk_info_list.append((i, end_date_str, duration_str))
+        end_dt_utc -= timedelta(days=days_for_this_chunk)
+        remaining -= days_for_this_chunk
+        idx += 1
 
     return chunk_info_list
 
 
 # ---------------------------------------------------------------------------
-#   5) Main
+#   4) Main
 # ---------------------------------------------------------------------------
 def main():
     # 1) Load config.yaml
@@ -205,69 +224,67 @@ def main():
     chunk_count = len(chunk_defs)
     logging.info(f"Will fetch {chunk_count} chunks total (each up to {chunk_days} days).")
 
-    # 6) We'll limit concurrency to 6 connections at once
+    # 6) We'll limit concurrency to this many connections at once
     max_concurrency = 8
 
-    # We'll store chunk results in a dictionary: {chunkIndex: [list_of_bars]}
+    # We'll store chunk results in a dictionary: {chunkIndex: columns}
     results_dict = {}
 
-    # 7) Submit chunks in waves of up to 6 parallel threads
-    i = 0
-    while i < chunk_count:
-        wave = chunk_defs[i : i + max_concurrency]  # slice up to concurrency
-        wave_threads = []
-
-        # launch each chunk in this wave
-        for (chunkIndex, end_dt, dur_str) in wave:
-            t = Thread(
-                target=fetch_chunk_in_thread,
-                args=(
-                    chunkIndex,
-                    host,
-                    port,
-                    contract,
-                    end_dt,
-                    dur_str,
-                    bar_size,
-                    what_to_show,
-                    useRTH,
-                    formatDate,
-                    timeout,
-                    results_dict
-                ),
-                daemon=True
-            )
-            wave_threads.append(t)
-            t.start()
-
-            # *** ADD A DELAY AFTER STARTING EACH THREAD ***
-            time.sleep(0.5)  # 300-500 ms to stagger connection attempts
-
-        # wait for all threads in this wave to finish
-        for t in wave_threads:
-            t.join()
-
-        i += max_concurrency  # proceed to the next wave
-
-    # 8) Combine all bars from results_dict
-    all_bars = []
-    for chunk_id in sorted(results_dict.keys()):
-        all_bars.extend(results_dict[chunk_id])
-
-    # sort everything by time
-    def sort_key(bar):
-        return parse_ib_datetime(bar["time"])
-    all_bars.sort(key=sort_key)
-
-    logging.info(f"Total bars collected across all chunks: {len(all_bars)}")
-
-    # 9) Write to CSV
+    # 7) Connect once; every chunk request is multiplexed over this one
+    #    socket and routed back by reqId, so there is no per-chunk login
+    #    handshake and no connection-stagger sleep.
+    app = HistDataApp()
+    client_id = 100
+    logging.info(f"Connecting to IB @ {host}:{port}, clientId={client_id}")
+    app.connect(host, port, client_id)
+    api_thread = Thread(target=app.run, daemon=True)
+    api_thread.start()
+
+    # Submit every chunk up front; the semaphore bounds how many requests
+    # are in flight at a time, and a new chunk starts the moment any
+    # running one finishes instead of waiting out a whole wave.
+    sem = threading.BoundedSemaphore(max_concurrency)
+    try:
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = {
+                executor.submit(
+                    fetch_chunk_in_thread,
+                    app, chunkIndex, contract, end_dt, dur_str,
+                    bar_size, what_to_show, useRTH, formatDate, timeout,
+                    results_dict, sem,
+                ): chunkIndex
+                for (chunkIndex, end_dt, dur_str) in chunk_defs
+            }
+            for future in as_completed(futures):
+                future.result()  # re-raise any worker exception
+    finally:
+        if app.isConnected():
+            app.disconnect()
+
+    # 8) Combine all chunk columns from results_dict
     fieldnames = ["time", "open", "high", "low", "close", "volume"]
-    with open(output_file, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for bar in all_bars:
-            writer.writerow(bar)
+    frames = [pd.DataFrame(results_dict[chunk_id]) for chunk_id in sorted(results_dict.keys())]
+    if frames:
+        df = pd.concat(frames, ignore_index=True)
+    else:
+        df = pd.DataFrame(columns=fieldnames)
+
+    # sort everything by time — one vectorized parse of the whole column
+    # (intraday stamps, falling back to daily) instead of a per-bar
+    # strptime sort key
+    parsed = pd.to_datetime(df["time"], format="%Y%m%d  %H:%M:%S", errors="coerce")
+    if parsed.isna().any():
+        parsed = parsed.fillna(pd.to_datetime(df["time"], format="%Y%m%d", errors="coerce"))
+    df = df.iloc[parsed.argsort(kind="stable")]
+
+    # adjacent chunk windows share their boundary timestamp (each window's
+    # end is the next one's start), so drop the duplicated boundary bars
+    df = df.drop_duplicates(subset="time", keep="first")
+
+    logging.info(f"Total bars collected across all chunks: {len(df)}")
+
+    # 9) Write to CSV in one C-level pass instead of a per-row dict loop
+    df.to_csv(output_file, index=False)
 
     logging.info(f"Historical bars saved to {output_file}")
     logging.info("Done.")
@@ -1,18 +1,28 @@
-import os
-
-def ensure_init_py(directory):
-    """
-    Recursively traverse directories and ensure each folder contains an __init__.py file.
-    """
-    for root, dirs, files in os.walk(directory):
-        if any(fname.endswith(".py") for fname in files) or dirs:
-            init_file = os.path.join(root, '__init__.py')
-            if not os.path.exists(init_file):
-                with open(init_file, 'w') as f:
-                    pass  # Create an empty __init__.py file
-                print(f"Created: {init_file}")
-
-if __name__ == "__main__":
-    root_dir = os.getcwd()  # Use current working directory
-    ensure_init_py(root_dir)
-
+import os
+
+def ensure_init_py(directory):
+    """
+    Recursively traverse directories and ensure each folder contains an __init__.py file.
+
+    Uses os.scandir instead of os.walk: DirEntry carries the file type
+    from the directory read itself, so the traversal issues no per-entry
+    stat calls, and the listed names also answer "is __init__.py already
+    here?" without an extra os.path.exists.
+    """
+    with os.scandir(directory) as it:
+        entries = list(it)
+    subdirs = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+    has_py = any(entry.name.endswith(".py") and entry.is_file(follow_symlinks=False)
+                 for entry in entries)
+    if has_py or subdirs:
+        if not any(entry.name == "__init__.py" for entry in entries):
+            init_file = os.path.join(directory, "__init__.py")
+            with open(init_file, 'w'):
+                pass  # Create an empty __init__.py file
+            print(f"Created: {init_file}")
+    for subdir in subdirs:
+        ensure_init_py(subdir)
+
+if __name__ == "__main__":
+    root_dir = os.getcwd()  # Use current working directory
+    ensure_init_py(root_dir)
@@ -4,25 +4,44 @@ try:
 except ImportError:
     # Define a simple Order class if ibapi is not available (for simulation purposes)
     class Order:
+        # Fixed slots instead of a per-instance __dict__: these objects are
+        # churned on every simulated signal.
+        __slots__ = ('action', 'orderType', 'totalQuantity', 'lmtPrice', 'auxPrice',
+                     'parentId', 'transmit')
         def __init__(self):
             self.action = None
             self.orderType = None
             self.totalQuantity = 0
             self.lmtPrice = None
+            self.auxPrice = None
+            self.parentId = 0
+            self.transmit = True
         def __repr__(self):
             return f"<Order {self.orderType} {self.action} {self.totalQuantity}@{self.lmtPrice}>"
 
-def create_limit_order(action: str, quantity: int, limit_price: float):
+def build_order(action: str, order_type: str, quantity: int,
+                lmt_price: float = None, aux_price: float = None):
     """
-    Helper to create a limit order object for IB or simulation.
+    Single factory for the Order objects used across the execution
+    modules (market, limit and stop), so the attribute assignments live
+    in one place instead of being repeated at every call site.
     """
     order = Order()
     order.action = action
-    order.orderType = "LMT"
+    order.orderType = order_type
     order.totalQuantity = quantity
-    order.lmtPrice = limit_price
+    if lmt_price is not None:
+        order.lmtPrice = lmt_price
+    if aux_price is not None:
+        order.auxPrice = aux_price
     return order
 
+def create_limit_order(action: str, quantity: int, limit_price: float):
+    """
+    Helper to create a limit order object for IB or simulation.
+    """
+    return build_order(action, "LMT", quantity, lmt_price=limit_price)
+
 def execute_limit_order(ib_connection, contract, action: str, quantity: int, limit_price: float):
     """
     Execute a limit order (either BUY or SELL) at the specified price.
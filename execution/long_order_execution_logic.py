@@ -1,11 +1,5 @@
 import logging
-from execution.limit_order_execution_logic import execute_limit_order, create_limit_order
-
-try:
-    from ibapi.order import Order
-except ImportError:
-    # Use the Order class from limit_order_execution_logic if available
-    from execution.limit_order_execution_logic import Order
+from execution.limit_order_execution_logic import execute_limit_order, build_order
 
 def execute_long_order(ib_connection, contract, quantity: int, limit_price: float = None):
     """
@@ -16,9 +10,6 @@ def execute_long_order(ib_connection, contract, quantity: int, limit_price: floa
         execute_limit_order(ib_connection, contract, "BUY", quantity, limit_price)
     else:
         # Place a market buy order
-        order = Order()
-        order.action = "BUY"
-        order.orderType = "MKT"
-        order.totalQuantity = quantity
+        order = build_order("BUY", "MKT", quantity)
         logging.info(f"Executing market buy order for quantity {quantity}")
         ib_connection.place_order(contract, order)
@@ -1,10 +1,5 @@
 import logging
-from execution.limit_order_execution_logic import execute_limit_order, create_limit_order
-
-try:
-    from ibapi.order import Order
-except ImportError:
-    from execution.limit_order_execution_logic import Order
+from execution.limit_order_execution_logic import execute_limit_order, build_order
 
 def execute_short_order(ib_connection, contract, quantity: int, limit_price: float = None):
     """
@@ -15,9 +10,6 @@ def execute_short_order(ib_connection, contract, quantity: int, limit_price: flo
         execute_limit_order(ib_connection, contract, "SELL", quantity, limit_price)
     else:
         # Place a market sell order (for shorting or selling a long position)
-        order = Order()
-        order.action = "SELL"
-        order.orderType = "MKT"
-        order.totalQuantity = quantity
+        order = build_order("SELL", "MKT", quantity)
         logging.info(f"Executing market sell order for quantity {quantity}")
         ib_connection.place_order(contract, order)
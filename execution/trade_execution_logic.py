@@ -3,8 +3,7 @@
 import logging
 from execution.long_order_execution_logic import execute_long_order
 from execution.short_order_execution_logic import execute_short_order
-from execution.limit_order_execution_logic import execute_limit_order
-from execution.stop_loss_order_execution_logic import place_stop_loss_order
+from execution.limit_order_execution_logic import build_order, create_limit_order
 
 class TradeExecutor:
     """
@@ -15,6 +14,13 @@ class TradeExecutor:
         self.ib = ib_connection  # might be None in backtest
         self.contract = contract # might be None in backtest
         self.config = config     # store config for reference
+        # Hash-based dispatch instead of an if/elif chain over the signal
+        # type; new signal types just add an entry here.
+        self._dispatch = {
+            "LONG": self._do_long,
+            "SHORT": self._do_short,
+            "EXIT": self._do_exit,
+        }
 
     def execute_trade(self, signal: dict):
         """
@@ -27,42 +33,65 @@ class TradeExecutor:
         - position_type (for "EXIT")
         """
         trade_type = signal.get('type')
-        quantity = signal.get('quantity', 0)
-        price = signal.get('price', None)
 
         # If no IB connection, we are in backtest mode => skip real order
         if self.ib is None or self.contract is None:
-            logging.info(f"[Backtest Mode] Would execute {trade_type} order, qty={quantity}, price={price}")
+            logging.info(f"[Backtest Mode] Would execute {trade_type} order, "
+                         f"qty={signal.get('quantity', 0)}, price={signal.get('price')}")
             # Optionally do more logging or simulated fills
             return
 
         # Otherwise place real IB order
-        if trade_type == "LONG":
-            logging.info(f"TradeExecutor: Initiating LONG position for quantity {quantity}")
+        self._dispatch.get(trade_type, self._do_unknown)(signal)
+
+    def _do_long(self, signal: dict):
+        quantity = signal.get('quantity', 0)
+        price = signal.get('price', None)
+        logging.info(f"TradeExecutor: Initiating LONG position for quantity {quantity}")
+        # Stop/take-profit ride along as bracket children of the entry:
+        # one transmit group instead of three separate round-trips, and
+        # no window where the entry is live without its stop.
+        # Bind each signal key once instead of a truthiness lookup plus a
+        # second indexed lookup per key.
+        stop_loss = signal.get('stop_loss')
+        take_profit = signal.get('take_profit')
+        children = []
+        if stop_loss:
+            children.append(build_order("SELL", "STP", quantity, aux_price=stop_loss))
+        if take_profit:
+            children.append(build_order("SELL", "LMT", quantity, lmt_price=take_profit))
+        if children:
+            entry = (create_limit_order("BUY", quantity, price) if price is not None
+                     else build_order("BUY", "MKT", quantity))
+            self.ib.place_bracket_order(self.contract, entry, children)
+        else:
             execute_long_order(self.ib, self.contract, quantity, limit_price=price)
-            if signal.get('stop_loss'):
-                place_stop_loss_order(self.ib, self.contract, quantity, signal['stop_loss'], position_type="LONG")
-            if signal.get('take_profit'):
-                execute_limit_order(self.ib, self.contract, "SELL", quantity, signal['take_profit'])
 
-        elif trade_type == "SHORT":
-            logging.info(f"TradeExecutor: Initiating SHORT position for quantity {quantity}")
+    def _do_short(self, signal: dict):
+        quantity = signal.get('quantity', 0)
+        price = signal.get('price', None)
+        logging.info(f"TradeExecutor: Initiating SHORT position for quantity {quantity}")
+        stop_loss = signal.get('stop_loss')
+        take_profit = signal.get('take_profit')
+        children = []
+        if stop_loss:
+            children.append(build_order("BUY", "STP", quantity, aux_price=stop_loss))
+        if take_profit:
+            children.append(build_order("BUY", "LMT", quantity, lmt_price=take_profit))
+        if children:
+            entry = (create_limit_order("SELL", quantity, price) if price is not None
+                     else build_order("SELL", "MKT", quantity))
+            self.ib.place_bracket_order(self.contract, entry, children)
+        else:
             execute_short_order(self.ib, self.contract, quantity, limit_price=price)
-            if signal.get('stop_loss'):
-                place_stop_loss_order(self.ib, self.contract, quantity, signal['stop_loss'], position_type="SHORT")
-            if signal.get('take_profit'):
-                execute_limit_order(self.ib, self.contract, "BUY", quantity, signal['take_profit'])
 
-        elif trade_type == "EXIT":
-            pos_type = signal.get('position_type', 'LONG')
-            action = "SELL" if pos_type == "LONG" else "BUY"
-            from execution.limit_order_execution_logic import Order
-            order = Order()
-            order.action = action
-            order.orderType = "MKT"
-            order.totalQuantity = quantity
-            logging.info(f"TradeExecutor: Exiting position -> {action} {quantity} (market order)")
-            self.ib.place_order(self.contract, order)
+    def _do_exit(self, signal: dict):
+        quantity = signal.get('quantity', 0)
+        pos_type = signal.get('position_type', 'LONG')
+        action = "SELL" if pos_type == "LONG" else "BUY"
+        order = build_order(action, "MKT", quantity)
+        logging.info(f"TradeExecutor: Exiting position -> {action} {quantity} (market order)")
+        self.ib.place_order(self.contract, order)
 
-        else:
-            logging.warning(f"Unknown trade signal type: {trade_type}")
+    def _do_unknown(self, signal: dict):
+        logging.warning(f"Unknown trade signal type: {signal.get('type')}")
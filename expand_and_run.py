@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 
+import heapq
 import sys
 import glob
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import pandas as pd
 
+def _total_pl(csv_file):
+    """Total P/L of one trade log; only the P/L column is materialized."""
+    df = pd.read_csv(csv_file, usecols=["P/L"])
+    return float(pd.to_numeric(df["P/L"], errors="coerce").fillna(0.0).sum())
+
 def main():
     # 1) Get patterns from command line (like trade_log*.csv), expand them:
     if len(sys.argv) < 2:
@@ -20,32 +28,30 @@ def main():
         print("No CSV files found matching your patterns!")
         sys.exit(0)
 
-    # 2) Parse each file, gather results
-    #    For example: keep track of total P/L in a list.
+    # 2) Parse the files in parallel: pandas releases the GIL inside the
+    #    C parser, so threads overlap both disk I/O and parsing. Each
+    #    read only materializes the P/L column.
     results = []
-    for csv_file in all_files:
-        try:
-            df = pd.read_csv(csv_file)
-            # Make sure "P/L" is numeric
-            df["P/L"] = pd.to_numeric(df["P/L"], errors="coerce").fillna(0.0)
-            total_pl = df["P/L"].sum()
-            # Save (filename, total_pl) for sorting
-            results.append((csv_file, total_pl))
-        except Exception as e:
-            # Show the error if you want more detail
-            print(f"Could not parse '{csv_file}': {e}")
-            # or skip silently
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = {executor.submit(_total_pl, f): f for f in all_files}
+        for future in as_completed(futures):
+            csv_file = futures[future]
+            try:
+                # Save (filename, total_pl) for ranking
+                results.append((csv_file, future.result()))
+            except Exception as e:
+                # Show the error if you want more detail
+                print(f"Could not parse '{csv_file}': {e}")
+                # or skip silently
 
     if not results:
         print("No valid data to show after parsing.")
         sys.exit(0)
 
-    # 3) Sort by total P/L (descending) and show top 10
-    #    If you want “largest winning,” use reverse=True. 
-    #    For “largest losing,” keep reverse=False. Usually we do largest net profit at the top:
-    results.sort(key=lambda x: x[1], reverse=True)
-
-    top_10 = results[:10]
+    # 3) Pick the top 10 by total P/L. heapq.nlargest is O(N log 10)
+    #    vs O(N log N) for sorting everything just to keep ten rows —
+    #    noticeable when scanning thousands of trade logs.
+    top_10 = heapq.nlargest(10, results, key=lambda x: x[1])
     print("\nTop 10 by total P/L:")
     for filename, pl in top_10:
         print(f"{filename}: {pl}")
@@ -0,0 +1,22 @@
+# File: indicators/_njit.py
+
+"""
+Optional-numba shim for the indicator hot loops.
+
+`njit` is numba's real decorator when numba is installed; otherwise it
+is an identity decorator, so the scalar loops it wraps always exist and
+simply run as plain Python. Keeps the indicator modules free of
+per-module try/except numba blocks.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        # Support both @njit and @njit(cache=True, ...) spellings.
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(fn):
+            return fn
+        return wrap
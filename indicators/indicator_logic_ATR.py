@@ -1,8 +1,34 @@
 # File: indicators/indicator_logic_ATR.py
 
+import numpy as np
 import pandas as pd
 import logging
 
+from indicators._njit import njit
+
+@njit(cache=True, fastmath=True)
+def _atr_loop(highs, lows, closes, period):
+    """
+    Fused single pass over contiguous float64 arrays: true range and its
+    smoothing in one loop, no intermediate TR array. The recurrence is
+    the same ewm(span=period, adjust=False) smoothing the rest of this
+    module uses (alpha = 2/(period+1)), so jitted and pandas paths agree.
+    Returns the latest ATR value.
+    """
+    k = 2.0 / (period + 1.0)
+    # First bar has no previous close; true range is just the bar's range.
+    atr = highs[0] - lows[0]
+    for i in range(1, highs.shape[0]):
+        tr = highs[i] - lows[i]
+        hc = abs(highs[i] - closes[i - 1])
+        if hc > tr:
+            tr = hc
+        lc = abs(lows[i] - closes[i - 1])
+        if lc > tr:
+            tr = lc
+        atr = tr * k + atr * (1.0 - k)
+    return atr
+
 def calculate_ATR_series(df, high_col='high', low_col='low', close_col='close', period=14):
     """
     Existing function: Return a pandas Series with the ATR for each row in df.
@@ -12,40 +38,40 @@ def calculate_ATR_series(df, high_col='high', low_col='low', close_col='close',
             logging.error(f"DataFrame missing column '{col}' for ATR.")
             return pd.Series([None]*len(df))
 
-    prev_close = df[close_col].shift(1)
-    high_low = df[high_col] - df[low_col]
-    high_prevclose = (df[high_col] - prev_close).abs()
-    low_prevclose = (df[low_col] - prev_close).abs()
+    # Work on the raw float64 buffers; np.maximum.reduce computes the
+    # elementwise true range without pd.concat building a 3-column frame.
+    high = df[high_col].to_numpy(dtype=np.float64)
+    low = df[low_col].to_numpy(dtype=np.float64)
+    close = df[close_col].to_numpy(dtype=np.float64)
 
-    tr = pd.concat([high_low, high_prevclose, low_prevclose], axis=1).max(axis=1)
-    atr = tr.ewm(span=period, adjust=False).mean()
+    prev_close = np.empty_like(close)
+    prev_close[0] = close[0]
+    prev_close[1:] = close[:-1]
+
+    tr = np.maximum.reduce([high - low,
+                            np.abs(high - prev_close),
+                            np.abs(low - prev_close)])
+    # First bar has no previous close; true range is just the bar's range.
+    tr[0] = high[0] - low[0]
+
+    atr = pd.Series(tr, index=df.index).ewm(span=period, adjust=False).mean()
     return atr
 
 def calculate_ATR(highs, lows, closes, period=14):
     """
     NEW array-based helper:
-    Calculate the ATR from Python lists: `highs`, `lows`, `closes`.
+    Calculate the ATR from lists/arrays: `highs`, `lows`, `closes`.
     Returns the *latest* ATR value (float), or None if not enough data.
     """
-    if not highs or not lows or not closes:
+    if highs is None or lows is None or closes is None:
         return None
     if len(highs) < period + 1 or len(lows) < period + 1 or len(closes) < period + 1:
         return None
 
-    df = pd.DataFrame({
-        'high': highs,
-        'low':  lows,
-        'close': closes
-    })
-
-    # We can re-use the logic above
-    prev_close = df['close'].shift(1)
-    high_low = df['high'] - df['low']
-    high_prevclose = (df['high'] - prev_close).abs()
-    low_prevclose = (df['low'] - prev_close).abs()
-
-    tr = pd.concat([high_low, high_prevclose, low_prevclose], axis=1).max(axis=1)
-    atr_series = tr.ewm(span=period, adjust=False).mean()
-
-    # Return the most recent ATR value
-    return atr_series.iloc[-1]
+    # One conversion to contiguous float64, then the whole TR + smoothing
+    # pass runs inside the jitted loop (plain Python when numba is absent)
+    # instead of building a 3-column DataFrame per call.
+    return float(_atr_loop(np.ascontiguousarray(highs, dtype=np.float64),
+                           np.ascontiguousarray(lows, dtype=np.float64),
+                           np.ascontiguousarray(closes, dtype=np.float64),
+                           period))
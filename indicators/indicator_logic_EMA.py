@@ -1,8 +1,24 @@
 # File: indicators/indicator_logic_EMA.py
 
+import numpy as np
 import pandas as pd
 import logging
 
+from indicators._njit import njit
+
+@njit(cache=True, fastmath=True)
+def _ema_loop(prices, period):
+    """
+    Scalar ewm(span=period, adjust=False) recurrence over a contiguous
+    float64 array; returns the latest EMA. Runs as plain Python when
+    numba is not installed.
+    """
+    k = 2.0 / (period + 1.0)
+    ema = prices[0]
+    for i in range(1, prices.shape[0]):
+        ema = prices[i] * k + ema * (1.0 - k)
+    return ema
+
 def calculate_EMA_series(df, price_col='close', period=20):
     """
     Existing function: Return a pandas Series with the EMA for each row in df[price_col].
@@ -21,17 +37,16 @@ def calculate_EMA_series(df, price_col='close', period=20):
 def calculate_EMA(prices, period=20):
     """
     NEW array-based helper:
-    Calculate the EMA of a simple list of `prices`.
+    Calculate the EMA of a list/array of `prices`.
     Returns the *latest* EMA (a float), or None if not enough data.
     """
-    if not prices:
+    if prices is None or len(prices) == 0:
         return None
     if period <= 0:
         logging.error("EMA period must be > 0.")
         return None
 
-    # Convert to pandas Series and use ewm
-    s = pd.Series(prices)
-    ema_series = s.ewm(span=period, adjust=False).mean()
-    # Return the most recent EMA
-    return ema_series.iloc[-1]
+    # One conversion to contiguous float64, then the whole recurrence
+    # runs inside the jitted loop instead of building a pandas Series
+    # just to read its last element.
+    return float(_ema_loop(np.ascontiguousarray(prices, dtype=np.float64), period))
@@ -1,5 +1,6 @@
 # File: indicators/indicator_logic_RSI.py
 
+import numpy as np
 import pandas as pd
 import logging
 
@@ -14,13 +15,15 @@ def calculate_RSI_series(df, price_col='close', period=14):
     if len(df) < period + 1:
         logging.warning("Not enough rows to compute RSI for all rows.")
 
-    # Price changes
-    delta = df[price_col].diff()
-    gain = delta.where(delta > 0, other=0.0)
-    loss = -delta.where(delta < 0, other=0.0)
+    # Price changes, computed on the raw float64 buffer. np.diff/np.where
+    # skip the intermediate Series allocations that .diff()/.where() make.
+    prices = df[price_col].to_numpy(dtype=np.float64)
+    delta = np.diff(prices, prepend=prices[:1])
+    gain = np.where(delta > 0.0, delta, 0.0)
+    loss = np.where(delta < 0.0, -delta, 0.0)
 
-    avg_gain = gain.ewm(span=period, adjust=False).mean()
-    avg_loss = loss.ewm(span=period, adjust=False).mean()
+    avg_gain = pd.Series(gain, index=df.index).ewm(span=period, adjust=False).mean()
+    avg_loss = pd.Series(loss, index=df.index).ewm(span=period, adjust=False).mean()
 
     rs = avg_gain / avg_loss
     rsi = 100.0 - (100.0 / (1.0 + rs))
@@ -1,19 +1,82 @@
 import logging
+from collections import deque
 
-def calculate_VWAP(prices: list, volumes: list):
+import numpy as np
+
+class VWAPState:
     """
-    Calculate the Volume-Weighted Average Price (VWAP) for given price and volume lists.
-    VWAP = sum(price_i * volume_i) / sum(volume_i)&#8203;:contentReference[oaicite:6]{index=6}.
+    Incremental VWAP: feed one (price, volume) per bar and read the
+    current value in O(1), instead of re-running calculate_VWAP over the
+    full history on every new bar (O(N) per call, O(N^2) per session).
+
+    With no window this is the anchored/session VWAP - call reset() on a
+    session boundary. With `window` set, the trailing bars are kept in a
+    deque and the leaving bar is subtracted from the running sums.
     """
-    if not prices or not volumes or len(prices) != len(volumes):
+    __slots__ = ("sum_pv", "sum_v", "_window", "_bars")
+
+    def __init__(self, window: int = None):
+        self._window = window
+        self._bars = deque() if window else None
+        self.reset()
+
+    def reset(self):
+        """Start a new session/anchor."""
+        self.sum_pv = 0.0
+        self.sum_v = 0.0
+        if self._bars is not None:
+            self._bars.clear()
+
+    def update(self, price: float, volume: float):
+        """Fold one bar into the running sums and return the new VWAP."""
+        self.sum_pv += price * volume
+        self.sum_v += volume
+        if self._bars is not None:
+            self._bars.append((price, volume))
+            if len(self._bars) > self._window:
+                old_price, old_volume = self._bars.popleft()
+                self.sum_pv -= old_price * old_volume
+                self.sum_v -= old_volume
+        return self.value()
+
+    def value(self):
+        """Current VWAP, or None while no volume has been seen."""
+        return self.sum_pv / self.sum_v if self.sum_v else None
+
+def calculate_VWAP(prices, volumes):
+    """
+    Calculate the Volume-Weighted Average Price (VWAP) for given price and volume sequences.
+    VWAP = sum(price_i * volume_i) / sum(volume_i)​:contentReference[oaicite:6]{index=6}.
+    Accepts lists or ndarrays; the weighted sum runs as a single BLAS dot
+    product instead of a Python accumulation loop.
+    """
+    if prices is None or volumes is None or len(prices) != len(volumes) or len(prices) == 0:
         return None
-    total_volume = sum(volumes)
+    p = np.asarray(prices, dtype=np.float64)
+    v = np.asarray(volumes, dtype=np.float64)
+    total_volume = v.sum()
     if total_volume == 0:
         return None
-    # Compute VWAP as the weighted average of prices by volume&#8203;:contentReference[oaicite:7]{index=7}
-    weighted_sum = 0.0
-    for price, vol in zip(prices, volumes):
-        weighted_sum += price * vol
-    vwap = weighted_sum / total_volume
-    logging.debug(f"Calculated VWAP = {vwap:.4f}")
+    vwap = float(p @ v / total_volume)
+    logging.debug("Calculated VWAP = %.4f", vwap)
     return vwap
+
+def calculate_VWAP_rolling(prices, volumes, window: int):
+    """
+    Rolling VWAP over the trailing `window` bars, for every bar.
+    Uses prefix sums so the whole series costs O(N) instead of
+    recomputing an O(window) dot product per bar. Entries before a full
+    window use the partial (expanding) window; zero-volume windows are NaN.
+    """
+    p = np.asarray(prices, dtype=np.float64)
+    v = np.asarray(volumes, dtype=np.float64)
+    if p.size == 0 or p.size != v.size:
+        return None
+    cum_pv = np.cumsum(p * v)
+    cum_v = np.cumsum(v)
+    pv = cum_pv.copy()
+    vol = cum_v.copy()
+    pv[window:] -= cum_pv[:-window]
+    vol[window:] -= cum_v[:-window]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(vol > 0, pv / vol, np.nan)
@@ -91,7 +91,8 @@ class MESLiveApp(MESLiveWrapper, MESLiveClient):
         self._connect_and_start_thread()
 
         # Start a background thread that checks connectivity
-        self._stop_reconnect_checker = False
+        self._shutdown = threading.Event()
+        self._reconnect_attempts = 0
         self.reconnect_thread = threading.Thread(
             target=self.check_connection_loop, daemon=True
         )
@@ -111,7 +112,7 @@ class MESLiveApp(MESLiveWrapper, MESLiveClient):
         Disconnect from TWS and join threads, shutting down gracefully.
         """
         logging.info("Stopping app: disconnecting from IB and stopping reconnect thread...")
-        self._stop_reconnect_checker = True
+        self._shutdown.set()
 
         if self.isConnected():
             self.disconnect()
@@ -126,16 +127,26 @@ class MESLiveApp(MESLiveWrapper, MESLiveClient):
         """
         Periodically check if isConnected() is False. If so, attempt reconnect.
         """
-        while not self._stop_reconnect_checker:
-            time.sleep(5)  # check every 5 seconds
-            if not self.isConnected():
+        while not self._shutdown.wait(5):  # check every 5 seconds
+            if self.isConnected():
+                self._reconnect_attempts = 0
+            else:
                 logging.warning("Detected IB disconnect! Attempting to reconnect...")
                 self.reconnect_and_resubscribe()
 
     def reconnect_and_resubscribe(self):
         """
-        Attempt to reconnect and re-subscribe if disconnected.
+        Attempt to reconnect and re-subscribe if disconnected, backing off
+        exponentially (0.5s, 1s, 2s, ... capped at 30s) between attempts so
+        a persistent TWS outage doesn't spin this thread.
         """
+        delay = min(30, 0.5 * (2 ** self._reconnect_attempts))
+        self._reconnect_attempts += 1
+        # Event.wait doubles as an interruptible sleep: returns True (and we
+        # bail out) the moment stop() is called.
+        if self._shutdown.wait(delay):
+            return
+
         # Disconnect fully (just in case).
         try:
             if self.isConnected():
@@ -146,8 +157,9 @@ class MESLiveApp(MESLiveWrapper, MESLiveClient):
         # Start fresh
         self._connect_and_start_thread()
 
-        # Wait a moment to ensure the new connection is established
-        time.sleep(2)
+        # Give the new connection a moment to establish, still interruptible
+        if self._shutdown.wait(2):
+            return
 
         # Re-subscribe to real-time bars
         self.request_realtime_bars()
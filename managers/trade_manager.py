@@ -4,6 +4,8 @@ import csv
 import logging
 from datetime import datetime
 
+import pandas as pd
+
 from managers.entry_manager import EntryManager
 from managers.exit_manager import ExitManager
 from managers.stop_loss_manager import StopLossManager
@@ -18,6 +20,12 @@ class TradeManager:
       Trade #, Date, Time, Symbol, Entry Price, Stop Loss, Target Price,
       Exit Price, Exit Date, Exit Time, Result, P/L, Comments, Side
     """
+    LOG_COLUMNS = [
+        "Trade #", "Date", "Time", "Symbol", "Entry Price", "Stop Loss",
+        "Target Price", "Exit Price", "Exit Date", "Exit Time", "Result",
+        "P/L", "Comments", "Side"
+    ]
+
     def __init__(self,
                  entry_manager: EntryManager,
                  exit_manager: ExitManager,
@@ -36,6 +44,7 @@ class TradeManager:
 
         self.current_position = None  # holds info about the open position (if any)
         self.trade_counter = 0        # increments for every new trade
+        self.trade_records = []       # in-memory mirror of the CSV rows
 
         self._ensure_log_headers()
 
@@ -45,11 +54,7 @@ class TradeManager:
         If an old version exists, please delete it so that the new header (with 14 columns)
         is written.
         """
-        header = [
-            "Trade #", "Date", "Time", "Symbol", "Entry Price", "Stop Loss",
-            "Target Price", "Exit Price", "Exit Date", "Exit Time", "Result",
-            "P/L", "Comments", "Side"
-        ]
+        header = self.LOG_COLUMNS
         if not os.path.isfile(self.log_filename):
             with open(self.log_filename, mode="w", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
@@ -204,10 +209,38 @@ class TradeManager:
             side=self.current_position['type'].upper()
         )
 
+        # Keep an unformatted copy in memory so stats can run without
+        # re-reading the CSV we just wrote.
+        self.trade_records.append({
+            "Trade #": self.current_position['trade_id'],
+            "Date": self.current_position['date'],
+            "Time": self.current_position['time'],
+            "Symbol": self.current_position['symbol'],
+            "Entry Price": self.current_position['entry_price'],
+            "Stop Loss": self.current_position['stop_loss'],
+            "Target Price": self.current_position['take_profit'],
+            "Exit Price": data_point['close'],
+            "Exit Date": exit_date,
+            "Exit Time": exit_time,
+            "Result": result_str,
+            "P/L": profit,
+            "Comments": exit_reason or "",
+            "Side": self.current_position['type'].upper(),
+        })
+
         logging.info(f"TradeManager: Exited {self.current_position['type']} at {data_point['close']:.4f} "
                      f"(Reason: {exit_reason}), P/L={profit:.2f}")
         self.current_position = None
 
+    @property
+    def trades_df(self):
+        """
+        All completed trades as a DataFrame with the CSV log's columns.
+        The columns are passed explicitly so a zero-trade run still
+        yields the full schema, just like the always-written CSV header.
+        """
+        return pd.DataFrame(self.trade_records, columns=self.LOG_COLUMNS)
+
     def _log_trade_to_csv(self,
                           trade_id,
                           date,         # entry date
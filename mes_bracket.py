@@ -0,0 +1,281 @@
+"""
+Shared MES bracket-order bot.
+
+Entry scripts parametrize side, offsets, expiry, and client id and call
+BracketBot(...).run_blocking(); the connection handshake, order
+prototypes, tick rounding, and event-driven waits live here once instead
+of being copied per script.
+"""
+
+import copy
+import functools
+import sys
+import threading
+
+from ibapi.client import EClient
+from ibapi.wrapper import EWrapper
+from ibapi.contract import Contract
+from ibapi.order import Order
+from ibapi.common import OrderId
+
+# Bracket prices must land on the MES tick boundary or TWS rejects the
+# order, costing a round trip.
+_TICK = 0.25
+
+# OCA group so that if one child fills, TWS cancels the other
+OCA_GROUP_NAME = "DYN_BRACKET_OCA"
+
+
+def _round_to_tick(price: float) -> float:
+    return round(price / _TICK) * _TICK
+
+
+def clean_order(order: Order) -> Order:
+    """
+    Force these attributes to exist (and be False).
+    If we don't define them, IB Python API will try make_field(order.allOrNone)
+    and crash if 'allOrNone' doesn't exist.
+    """
+    order.allOrNone = False
+    order.eTradeOnly = False
+    order.firmQuoteOnly = False
+    return order
+
+
+@functools.lru_cache(maxsize=4)
+def mes_contract(expiry: str) -> Contract:
+    """Build (once per expiry) and return the shared MES contract."""
+    contract = Contract()
+    contract.symbol = "MES"
+    contract.secType = "FUT"
+    contract.exchange = "CME"
+    contract.currency = "USD"
+    contract.lastTradeDateOrContractMonth = expiry
+    return contract
+
+
+# Prototype orders, built once per (action, orderType) pair. Order.__init__
+# sets ~80 default fields, so per-bracket construction is a shallow copy
+# plus the handful of fields that actually vary.
+_ORDER_TEMPLATES = {}
+
+
+def _order_template(action: str, order_type: str) -> Order:
+    key = (action, order_type)
+    template = _ORDER_TEMPLATES.get(key)
+    if template is None:
+        order = Order()
+        order.action = action
+        order.orderType = order_type
+        order.totalQuantity = 1
+        if order_type != "MKT":
+            order.ocaGroup = OCA_GROUP_NAME
+            order.ocaType = 1  # 1 = CANCEL_WITH_BLOCK (typical OCA)
+        template = _ORDER_TEMPLATES[key] = clean_order(order)
+    return template
+
+
+class BracketBot(EWrapper, EClient):
+    """
+    Places a market parent order, waits for the fill, then arms an OCA
+    take-profit/stop-loss pair around the fill price.
+    """
+
+    def __init__(self, side: str, tp_offset: float, sl_offset: float,
+                 expiry: str, client_id: int, quantity: int = 1,
+                 host: str = "127.0.0.1", port: int = 7497):
+        EWrapper.__init__(self)
+        EClient.__init__(self, wrapper=self)
+
+        if side not in ("BUY", "SELL"):
+            raise ValueError(f"side must be BUY or SELL, got {side!r}")
+        self.side = side
+        self.exit_action = "SELL" if side == "BUY" else "BUY"
+        self.tp_offset = tp_offset
+        self.sl_offset = sl_offset
+        self.expiry = expiry
+        self.client_id = client_id
+        self.quantity = quantity
+        self.host = host
+        self.port = port
+
+        self.next_order_id = None
+        self._reader = None
+        # Signalled by connectAck once the TWS handshake completes
+        self._connected_evt = threading.Event()
+        # Signalled by nextValidId so callers can block without polling
+        self._id_ready = threading.Event()
+
+        # Track parent info
+        self.parent_order_id = None
+        self.parent_fill_price = None
+
+        # Make sure we only place child orders once
+        self.child_orders_placed = False
+
+        # Child order ids awaiting an orderStatus acknowledgment from TWS;
+        # once both have been seen we know the bracket is live and can exit.
+        self._pending_child_ids = set()
+        self._children_acked_evt = threading.Event()
+
+    # -------------------------
+    # CONNECTION / LIFECYCLE
+    # -------------------------
+
+    def connect_and_start(self):
+        print("Connecting to IB Gateway/TWS...")
+        self.connect(self.host, self.port, clientId=self.client_id)
+
+        # Start the reader thread. daemon=True so an abnormal exit is not
+        # held hostage by the socket loop; we keep the handle to join on
+        # shutdown once disconnect() has closed the socket.
+        self._reader = threading.Thread(target=self.run, name="ibapi-reader", daemon=True)
+        self._reader.start()
+
+        # Wait for the connection handshake instead of a fixed sleep;
+        # connectAck fires as soon as TWS accepts, typically well under 100ms.
+        if not self._connected_evt.wait(timeout=5) or not self.isConnected():
+            print(f"Still not connected. Check TWS is open, port={self.port}, "
+                  f"API enabled, no firewall blocks.")
+            sys.exit(1)
+
+        # Request the next valid ID
+        self.reqIds(-1)
+
+        # Wait until we have an order ID (woken by the nextValidId callback)
+        print("Waiting for next valid order ID...")
+        if not self._id_ready.wait(timeout=10):
+            print("Never received nextValidId from TWS. Exiting.")
+            sys.exit(1)
+
+        # Place the parent MARKET order
+        self.place_parent_market_order()
+
+    def run_blocking(self):
+        """
+        Connect, place the bracket, and block until TWS has acknowledged
+        both child legs (or Ctrl-C), then disconnect. Waiting here — not in
+        the orderStatus callback, which runs on the reader thread — keeps
+        the callbacks free to deliver those acks.
+        """
+        self.connect_and_start()
+        try:
+            if not self._children_acked_evt.wait(timeout=120):
+                print("Timed out waiting for child order acknowledgments.")
+        except KeyboardInterrupt:
+            print("Interrupted. Disconnecting...")
+        else:
+            print("All orders placed. Exiting script now.")
+        self.disconnect()
+        if self._reader is not None:
+            # The socket EOF from disconnect() wakes EClient.run() immediately.
+            self._reader.join(timeout=1)
+
+    # -------------------------
+    # ORDER PLACEMENT
+    # -------------------------
+
+    def place_parent_market_order(self):
+        self.parent_order_id = self.next_order_id
+        self.next_order_id += 1
+
+        parent_order = copy.copy(_order_template(self.side, "MKT"))
+        parent_order.orderId = self.parent_order_id
+        parent_order.totalQuantity = self.quantity
+        parent_order.transmit = True  # send immediately
+
+        print(f"Placing parent {self.side} MARKET order (ID={self.parent_order_id})...")
+        self.placeOrder(self.parent_order_id, mes_contract(self.expiry), parent_order)
+
+    def place_child_orders(self):
+        """
+        Instead of referencing the now-filled parent order, place an OCA
+        group with two orders: a limit (take-profit) and a stop (stop-loss).
+        That way, TWS won't complain that we're modifying a filled parent.
+        The take-profit is held with transmit=False and the stop transmits
+        the pair in one go.
+        """
+        fill_price = self.parent_fill_price
+
+        # Offsets point away from the entry in the profitable/protective
+        # direction for the side traded, snapped to the MES tick so TWS
+        # doesn't reject a sub-tick price (avgFillPrice can be sub-tick
+        # when a multi-lot parent fills at mixed prices)
+        direction = 1.0 if self.side == "BUY" else -1.0
+        take_profit_price = _round_to_tick(fill_price + direction * self.tp_offset)
+        stop_loss_price = _round_to_tick(fill_price - direction * self.sl_offset)
+
+        tp_id = self.next_order_id
+        self.next_order_id += 1
+        sl_id = self.next_order_id
+        self.next_order_id += 1
+
+        # TAKE-PROFIT (Limit)
+        tp_order = copy.copy(_order_template(self.exit_action, "LMT"))
+        tp_order.orderId = tp_id
+        tp_order.totalQuantity = self.quantity
+        tp_order.lmtPrice = take_profit_price
+        tp_order.transmit = False  # We'll transmit with the stop
+
+        # STOP-LOSS (Stop)
+        sl_order = copy.copy(_order_template(self.exit_action, "STP"))
+        sl_order.orderId = sl_id
+        sl_order.totalQuantity = self.quantity
+        sl_order.auxPrice = stop_loss_price
+        sl_order.transmit = True  # This final child transmits the bracket
+
+        print(f"\nPlacing OCA child orders (no parentId, but OCA linked):\n"
+              f"  TAKE-PROFIT (ID={tp_id}) @ {take_profit_price}\n"
+              f"  STOP-LOSS   (ID={sl_id}) @ {stop_loss_price}\n")
+
+        self._pending_child_ids = {tp_id, sl_id}
+        contract = mes_contract(self.expiry)
+        self.placeOrder(tp_id, contract, tp_order)
+        self.placeOrder(sl_id, contract, sl_order)
+
+    # -------------------------
+    # EWrapper EVENT HANDLERS
+    # -------------------------
+
+    def connectAck(self):
+        super().connectAck()
+        self._connected_evt.set()
+
+    def nextValidId(self, orderId: OrderId):
+        super().nextValidId(orderId)
+        self.next_order_id = orderId
+        self._id_ready.set()
+        print(f"Received nextValidId: {orderId}")
+
+    def orderStatus(self, orderId, status, filled, remaining,
+                    avgFillPrice, permId, parentId, lastFillPrice,
+                    clientId, whyHeld, mktCapPrice):
+        print(f"orderStatus: ID={orderId}, Status={status}, "
+              f"Filled={filled}, AvgPrice={avgFillPrice}")
+
+        # Track child acknowledgments so run_blocking can exit as soon as
+        # TWS confirms both bracket legs.
+        if orderId in self._pending_child_ids:
+            self._pending_child_ids.discard(orderId)
+            if not self._pending_child_ids:
+                self._children_acked_evt.set()
+
+        # If the parent order is FILLED (and we haven't placed children yet):
+        if (orderId == self.parent_order_id
+            and status.upper() == "FILLED"
+            and not self.child_orders_placed):
+
+            self.child_orders_placed = True
+            self.parent_fill_price = avgFillPrice
+
+            print(f"Parent order {orderId} FILLED at {avgFillPrice}. Placing child orders now...")
+            self.place_child_orders()
+
+    def execDetails(self, reqId, contract, execution):
+        super().execDetails(reqId, contract, execution)
+        print(f"execDetails: {execution}")
+
+    def error(self, reqId, errorCode, errorString, advancedOrderRejectJson=None):
+        print(f"Error: reqId={reqId}, code={errorCode}, msg={errorString}")
+        if advancedOrderRejectJson:
+            print(f"AdvancedOrderRejectJson: {advancedOrderRejectJson}")
@@ -0,0 +1,29 @@
+# File: perf/drawdown_kernel.py
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+def _running_peak_dd(pl, initial_capital):
+    """
+    Fused single pass over a trade P/L array.
+    Returns (final_equity, max_equity, max_drawdown) — the same numbers
+    as cumsum + maximum.accumulate + subtraction, but in one memory
+    sweep, which matters once trade logs reach millions of rows.
+    """
+    eq = initial_capital
+    peak = initial_capital
+    mdd = 0.0
+    for i in range(pl.size):
+        eq += pl[i]
+        if eq > peak:
+            peak = eq
+        d = peak - eq
+        if d > mdd:
+            mdd = d
+    return eq, peak, mdd
+
+# Only worth using when JIT-compiled; callers fall back to their numpy
+# pipeline when numba is not installed.
+running_peak_dd = numba.njit(cache=True)(_running_peak_dd) if numba is not None else None
@@ -1,14 +1,24 @@
+import functools
 import logging
+import os
 import yaml
 
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime: float):
+    """Parse the YAML once per (path, mtime); `mtime` only keys the cache."""
+    with open(config_path, 'r') as f:
+        return yaml.safe_load(f)
+
 def load_config(config_path: str = "config.yaml"):
     """
     Load configuration from a YAML file.
+
+    Parsed configs are cached keyed on the file's mtime, so the repeated
+    load_config() calls scattered across the scripts hit the cache while
+    an edited file still re-parses.
     """
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-            return config
+        return _load_config_cached(config_path, os.path.getmtime(config_path))
     except Exception as e:
         logging.error(f"Failed to load config file {config_path}: {e}")
         return None
@@ -1,6 +1,15 @@
 from ib_insync import IB, Contract, Order
 from datetime import datetime
 
+# ib_insync drives the IB socket from an asyncio loop; if uvloop is
+# installed, use it for a faster loop. Purely optional.
+try:
+    import asyncio
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 def place_scalping_bracket_order():
     """
     Place a market order, retrieve the fill price, and create OCA stop-loss and limit orders.
@@ -65,7 +74,7 @@ def place_scalping_bracket_order():
         stop_loss_order.auxPrice = stop_price
         stop_loss_order.ocaGroup = oca_group
         stop_loss_order.ocaType = 1  # Cancel the other order if executed
-        stop_loss_order.transmit = True  # Do not transmit until limit order is ready
+        stop_loss_order.transmit = False  # Held until the limit order transmits the pair
 
         # Limit order
         limit_order = Order()
@@ -75,12 +84,13 @@ def place_scalping_bracket_order():
         limit_order.lmtPrice = limit_price
         limit_order.ocaGroup = oca_group
         limit_order.ocaType = 1  # Cancel the other order if executed
-        limit_order.transmit = True  # Transmit the entire OCA group
+        limit_order.transmit = True  # Transmits the entire OCA group in one go
 
-        # Step 4: Place the OCA orders with a small delay between them
+        # Step 4: Place the OCA orders back to back. ib_insync serializes
+        # submissions onto a single socket, so ordering is already guaranteed
+        # and no artificial delay is needed between the two.
         print(f"[INFO] Placing stop-loss order at {stop_price}...")
         ib.placeOrder(contract, stop_loss_order)
-        ib.sleep(0.1)  # Small delay to ensure proper sequencing
 
         print(f"[INFO] Placing limit order at {limit_price}...")
         ib.placeOrder(contract, limit_order)